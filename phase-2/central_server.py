@@ -1,20 +1,42 @@
 #!/usr/bin/env python3
 """Central server for the environmental monitoring system.
 Receives data from drones, displays it in real-time, and stores it for analysis."""
-from collections import defaultdict
+from collections import defaultdict, deque
 import socket
+import selectors
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import queue
 import datetime
 import time
 import argparse
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+import functools
+import heapq
+import itertools
+import numpy as np
+
+# matplotlib is imported by _load_matplotlib the first time the Charts tab is opened
+Figure = FigureCanvasTkAgg = NavigationToolbar2Tk = FuncFormatter = mdates = None
+
+# Check if orjson is available for faster parsing of drone messages
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    USING_ORJSON = False
+
+# Both parsers accept UTF-8 bytes directly, so received data is never decoded to str
+_json_loads = orjson.loads if USING_ORJSON else json.loads
+
+# Check if msgspec is available to decode drone messages straight into DroneReading structs
+try:
+    import msgspec
+    from typing import Optional
+    USING_MSGSPEC = True
+except ImportError:
+    USING_MSGSPEC = False
 
 # Check if ttkbootstrap is available
 try:
@@ -25,8 +47,251 @@ except ImportError:
     import tkinter.ttk as ttk
     USING_BOOTSTRAP = False
 
+# Fraction of the visible time span left empty to the right of the newest point,
+# so streaming data only triggers a full chart redraw when it runs past the view
+CHART_TIME_HEADROOM = 0.25
+
+# Number of points kept per chart series (ring buffer capacity)
+CHART_MAX_POINTS = 1000
+
+# Delay used to coalesce incoming data into a single chart refresh
+CHART_REFRESH_MS = 100
+
+# Minimum time between two data-driven redraws of the same chart (caps it at 5 FPS)
+CHART_MIN_REDRAW_INTERVAL = 0.2
+
+# Width of each selectable chart time range ("All Data" has no cutoff)
+CHART_TIMERANGES = {
+    "Last Hour": np.timedelta64(1, 'h'),
+    "Last 12 Hours": np.timedelta64(12, 'h'),
+    "Last 24 Hours": np.timedelta64(24, 'h'),
+}
+
+# Interval of the periodic flush that applies queued table updates in one batch,
+# and the maximum number of queued rows inserted per flush
+GUI_FLUSH_MS = 50
+GUI_FLUSH_BATCH = 200
+
+# Maximum number of lines kept in the system log; once exceeded, the oldest
+# LOG_TRIM_LINES lines are deleted in one go
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 500
+
+# A drone connection with no data for CONNECTION_TIMEOUT seconds is closed
+CONNECTION_TIMEOUT = 45
+
+# TCP keepalive settings for drone sockets, so the kernel detects dead peers:
+# first probe after KEEPALIVE_IDLE idle seconds, then every KEEPALIVE_INTERVAL
+# seconds, giving up after KEEPALIVE_COUNT unanswered probes
+KEEPALIVE_IDLE = 20
+KEEPALIVE_INTERVAL = 5
+KEEPALIVE_COUNT = 3
+
+# Size of the socket receive buffer, and the most reads spent draining one
+# readable socket before the other ready sockets get their turn
+RECV_BUFFER_SIZE = 65536
+RECV_MAX_READS = 16
+
+@functools.lru_cache(maxsize=128)
+def _prettify(s):
+    """Convert a snake_case status or issue to Title Case (other strings are returned unchanged)"""
+    return " ".join(word.capitalize() for word in s.split("_")) if "_" in s else s
+
+@functools.lru_cache(maxsize=128)
+def _classify_anomaly(issue):
+    """Map an anomaly issue to the anomaly table tag for its type"""
+    issue = issue.lower()
+    return "temperature" if "temp" in issue else \
+        "humidity" if "humid" in issue else \
+        "battery" if "battery" in issue else \
+        "connection"
+
+def _load_matplotlib():
+    """Import the matplotlib modules used by the charts (no-op after the first call)"""
+    global Figure, FigureCanvasTkAgg, NavigationToolbar2Tk, FuncFormatter, mdates
+    if Figure is not None:
+        return
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import FuncFormatter
+    import matplotlib.dates as mdates
+
+class BlitManager:
+    """Redraws animated artists over a cached background instead of re-rendering the figure"""
+
+    def __init__(self, canvas, ax, animated_artists=()):
+        """
+        Args:
+            canvas: FigureCanvas the artists are drawn on
+            ax: Axes whose area is restored and blitted
+            animated_artists: Artists created with animated=True
+        """
+        self.canvas = canvas
+        self.ax = ax
+        self._bg = None
+        self._artists = list(animated_artists)
+        # Every full draw (resize, zoom, toolbar pan) refreshes the cached background
+        self.cid = canvas.mpl_connect("draw_event", self.on_draw)
+
+    def on_draw(self, event):
+        """Capture the static background after a full draw and paint the artists on top"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._artists:
+            self.ax.draw_artist(artist)
+
+    def update(self):
+        """Repaint only the animated artists"""
+        if self._bg is None:
+            # No background yet; the next full draw captures it through on_draw
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+
+class VirtualTable:
+    """Shows a window of a long row history in a Treeview, materializing only the visible rows"""
+
+    def __init__(self, tree, scrollbar, maxlen):
+        """
+        Args:
+            tree: Treeview the rows are displayed in
+            scrollbar: Vertical scrollbar driven by this table instead of the Treeview
+            maxlen: Number of rows kept; older rows are dropped
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = deque(maxlen=maxlen)  # (values, tags) tuples, newest first
+        self.offset = 0  # Index of the first displayed row
+        self.visible = int(tree.cget("height"))  # Rows that fit in the widget
+        self._rowheight = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        self._items = []  # Reused Treeview item ids, one per visible row
+        self._shown = []  # Row currently shown by each item, to skip unchanged ones
+        
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", self._on_configure)
+        tree.bind("<MouseWheel>", self._on_mousewheel)
+        tree.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        tree.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+
+    def prepend(self, rows):
+        """Add rows (oldest first) at the top and refresh the visible window"""
+        for row in rows:
+            self.rows.appendleft(row)
+        # Keep the rows a scrolled-down user is looking at in place
+        if self.offset:
+            self.offset += len(rows)
+        self.render()
+
+    def yview(self, *args):
+        """Scrollbar command: "moveto fraction" or "scroll n units|pages" """
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = self.visible if args[2] == "pages" else 1
+            self.offset += int(args[1]) * step
+        self.render()
+
+    def render(self):
+        """Sync the Treeview items with the visible slice of rows"""
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        window = [self.rows[i] for i in range(self.offset, min(self.offset + self.visible, total))]
+        
+        # Grow or shrink the item pool to the window size
+        while len(self._items) < len(window):
+            self._items.append(self.tree.insert("", tk.END))
+            self._shown.append(None)
+        if len(self._items) > len(window):
+            self.tree.delete(*self._items[len(window):])
+            del self._items[len(window):], self._shown[len(window):]
+        
+        # Only rewrite items whose row changed
+        for i, row in enumerate(window):
+            if self._shown[i] is not row:
+                self.tree.item(self._items[i], values=row[0], tags=row[1])
+                self._shown[i] = row
+        
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(window)) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_configure(self, event):
+        # One row's worth of height is taken by the column headings
+        visible = max(1, event.height // self._rowheight - 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.render()
+
+    def _on_mousewheel(self, event):
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+        return "break"
+
+class DroneStatus:
+    """Latest status reported for one drone (fixed fields, no per-instance dict)"""
+
+    __slots__ = ("status", "timestamp", "battery", "temperature", "humidity")
+
+    def __init__(self, status, timestamp, battery, temperature, humidity):
+        self.status = status
+        self.timestamp = timestamp
+        self.battery = battery
+        self.temperature = temperature
+        self.humidity = humidity
+
+if USING_MSGSPEC:
+    class DroneReading(msgspec.Struct):
+        """One message received from a drone, decoded from JSON by a schema-specialized decoder"""
+
+        drone_id: Optional[str] = None
+        timestamp: Optional[str] = None
+        received_at: Optional[str] = None
+        temperature: Optional[float] = msgspec.field(default=None, name="average_temperature")
+        humidity: Optional[float] = msgspec.field(default=None, name="average_humidity")
+        battery: float = msgspec.field(default=0, name="battery_level")
+        status: str = "Connected"
+        anomalies: Optional[list] = None
+
+        def __post_init__(self):
+            if not self.timestamp:
+                self.timestamp = self.received_at
+
+    # Raises ValueError (msgspec.DecodeError) for invalid JSON and for fields of the wrong type
+    _decode_reading = msgspec.json.Decoder(DroneReading).decode
+else:
+    class DroneReading:
+        """One message received from a drone, with its fields read out of the parsed JSON once"""
+
+        __slots__ = ("drone_id", "timestamp", "temperature", "humidity", "battery", "status", "anomalies")
+
+        def __init__(self, drone_data):
+            self.drone_id = drone_data.get("drone_id")
+            self.timestamp = drone_data.get("timestamp") or drone_data.get("received_at")
+            self.temperature = drone_data.get("average_temperature")
+            self.humidity = drone_data.get("average_humidity")
+            self.battery = drone_data.get("battery_level", 0)
+            self.status = drone_data.get("status", "Connected")
+            self.anomalies = drone_data.get("anomalies")
+
+    def _decode_reading(line):
+        return DroneReading(_json_loads(line))
+
+# Stands in for a drone with no recorded status, so lookups need no None checks
+NO_STATUS = DroneStatus(None, None, 0, 0, 0)
+
+# Statuses in which a drone's readings are not charted and its anomalies are ignored
+INACTIVE_STATUSES = frozenset({"Returning To Base", "Charging"})
+
 class ServerGUI:
     
+    # Row tag for drone statuses that have their own color in the tables
+    _STATUS_TAG = {"Returning To Base": "returning", "Charging": "charging"}
+    # Status bar bootstyle per server status (anything else is "info")
+    _STATUS_STYLE = {"Running": "success", "Stopped": "danger", "Error": "warning"}
 
     def __init__(self, root):
         self.root = root
@@ -43,23 +308,50 @@ class ServerGUI:
         self.server_instance = None  # Will be set by CentralServer
         
         # Data storage
-        self.drone_statuses = {}  # Store latest status for each drone
-        self.drone_data = []  # Store all data entries
-        self.anomalies = []  # Store all anomalies
+        self.drone_statuses = {}  # Store latest DroneStatus for each drone
+        self._drone_rows = {}  # drone_id -> (values, tags) last written to drone_table (Tk thread only)
+        self.drone_data = deque(maxlen=1000)  # Store recent data entries (oldest dropped in O(1))
+        self.anomalies = deque(maxlen=1000)  # Store recent anomalies
         self.last_anomaly_report = defaultdict(dict)  # Track last reported anomaly for each drone
-        # Chart data storage
-        self.chart_data = {
-            "drone_ids": set(),
-            "timestamps": [],
-            "temperature": {},
-            "humidity": {}
-        }
+        # Chart points parsed by the network threads, drained into the ring buffers by the Tk thread
+        self._incoming = queue.SimpleQueue()
+        # Chart data storage: one fixed-size ring buffer per series (NaN marks a missing value);
+        # only the Tk thread reads or writes these, so they need no lock
+        self._ts_buf = np.empty(CHART_MAX_POINTS, dtype='datetime64[ms]')
+        self._temp_buf = np.empty(CHART_MAX_POINTS, dtype='f4')
+        self._hum_buf = np.empty(CHART_MAX_POINTS, dtype='f4')
+        self._buf_head = 0  # Slot the next point is written to
+        self._buf_len = 0  # Number of valid points in the buffers
+        self._buf_version = 0  # Bumped on every write; keys the filter cache
+        # Last filter_chart_data result as ((timerange, version), data), shared by both charts
+        self._filter_cache = None
+        # Charts with data not yet drawn, and whether a coalesced refresh is scheduled
+        self._temp_dirty = False
+        self._humidity_dirty = False
+        self._chart_refresh_pending = False
+        # time.monotonic() of each chart's last data-driven redraw, for the FPS cap
+        self._temp_last_draw = 0.0
+        self._humidity_last_draw = 0.0
+        # Table updates queued by the network threads and applied by _flush_gui;
+        # repeated status updates for one drone collapse to the latest (guarded by update_lock)
+        self._log_queue = deque()
+        self._anomaly_queue = deque()
+        self._drone_update_pending = {}
+        self._message_queue = deque()  # (message, level, args) lines for the system log
+        self._log_lines = 0  # number of lines currently in log_text
+        # (second, "%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ") for the current second, see _now_strings
+        self._ts_cache = (None, "", "")
+        # Server status and connection count currently shown in the status bar
+        self._last_status = None
+        self._last_connection_count = None
+        self._server_status_pending = None  # latest (status, count) not yet shown
         
         # Thread safety
         self.update_lock = threading.Lock()
         
         # Set up the UI
         self.setup_ui()
+        self.root.after(GUI_FLUSH_MS, self._flush_gui)
         
         # Register window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -87,6 +379,7 @@ class ServerGUI:
         main_tab = ttk.Frame(self.notebook)
         data_logs_tab = ttk.Frame(self.notebook)
         charts_tab = ttk.Frame(self.notebook)  # New charts tab
+        self.charts_tab = charts_tab
         
         # Add tabs to notebook
         self.notebook.add(main_tab, text="Main Dashboard")
@@ -120,6 +413,10 @@ class ServerGUI:
         
         # Setup status bar in main frame
         self.setup_status_bar(main_frame)
+        
+        # Charts are only redrawn while visible; catch up when one is brought into view
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.charts_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
     def setup_charts_panel(self, parent):
         """Set up the charts panel with temperature and humidity charts"""
@@ -130,6 +427,8 @@ class ServerGUI:
         # Create sub-tab frames
         temp_tab = ttk.Frame(self.charts_notebook)
         humidity_tab = ttk.Frame(self.charts_notebook)
+        self.temp_tab = temp_tab
+        self.humidity_tab = humidity_tab
         
         # Add sub-tabs to notebook
         self.charts_notebook.add(temp_tab, text="Temperature")
@@ -141,89 +440,100 @@ class ServerGUI:
         humidity_tab.grid_columnconfigure(0, weight=1)
         humidity_tab.grid_rowconfigure(0, weight=1)
         
-        # Prepare data storage for charts
-        self.chart_data = {
-            "timestamps": [],
-            "temperature": [],
-            "humidity": []
-        }
+        # The chart frames (and matplotlib itself) are created by _build_charts the first
+        # time the Charts tab is opened; until then data only accumulates in the ring buffers
+        self.charts_built = False
+        self.temp_paused = False
+        self.humidity_paused = False
+
+    def _build_charts(self):
+        """Import matplotlib and set up both chart frames (first visit to the Charts tab)"""
+        _load_matplotlib()
+        self.setup_temperature_chart(self.temp_tab)
+        self.setup_humidity_chart(self.humidity_tab)
+        self.charts_built = True
         
-        # Setup chart frames
-        self.setup_temperature_chart(temp_tab)
-        self.setup_humidity_chart(humidity_tab)
+        # Draw everything received so far once the charts are shown
+        self._temp_dirty = True
+        self._humidity_dirty = True
 
     def setup_temperature_chart(self, parent):
         """Set up the temperature chart with pause/zoom functionality"""
-        # Create frame for chart with padding
-        if USING_BOOTSTRAP:
-            chart_frame = ttk.Labelframe(parent, text="Temperature Over Time", padding=10, bootstyle="primary")
-        else:
-            chart_frame = ttk.LabelFrame(parent, text="Temperature Over Time", padding=10)
-            
-        chart_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        
-        # Configure grid weights
-        chart_frame.grid_columnconfigure(0, weight=1)
-        chart_frame.grid_rowconfigure(0, weight=1)
-        
-        # Create control frame for time range selection and controls
-        control_frame = ttk.Frame(chart_frame)
-        control_frame.grid(row=1, column=0, sticky="ew", pady=5)
-        
-        # Add time range selector
-        ttk.Label(control_frame, text="Time Range:").pack(side="left", padx=5)
-        self.temp_timerange_var = tk.StringVar(value="Last Hour")
-        timerange_combo = ttk.Combobox(control_frame, textvariable=self.temp_timerange_var, 
-                                    values=["Last Hour", "Last 12 Hours", "Last 24 Hours", "All Data"])
-        timerange_combo.pack(side="left", padx=5)
-        
-        # Add pause/resume button
-        self.temp_paused = False
-        self.temp_pause_btn = ttk.Button(control_frame, text="Pause", 
-                                    command=self.toggle_temp_pause)
-        self.temp_pause_btn.pack(side="left", padx=10)
-        
-        # Add zoom controls
-        ttk.Button(control_frame, text="Zoom In", 
-                command=lambda: self.zoom_temp_chart(0.8)).pack(side="left", padx=2)
-        ttk.Button(control_frame, text="Zoom Out", 
-                command=lambda: self.zoom_temp_chart(1.25)).pack(side="left", padx=2)
-        ttk.Button(control_frame, text="Reset Zoom", 
-                command=self.reset_temp_zoom).pack(side="left", padx=2)
-        
-        # Create matplotlib figure
-        self.temp_figure = Figure(figsize=(6, 4), dpi=100)
-        self.temp_plot = self.temp_figure.add_subplot(111)
-        self.temp_plot.set_title("Drone Temperature Readings")
-        self.temp_plot.set_xlabel("Time")
-        self.temp_plot.set_ylabel("Temperature (°C)")
-        self.temp_plot.grid(True)
+        chart = self._setup_series_chart(
+            parent, "Temperature Over Time", "Drone Temperature Readings", "Temperature (°C)",
+            color='#FF5733', label="Temperature", bootstyle="primary",
+            on_pause=self.toggle_temp_pause, on_zoom=self.zoom_temp_chart, on_reset=self.reset_temp_zoom)
+        
+        self.temp_timerange_var = chart["timerange_var"]
+        self.temp_pause_btn = chart["pause_btn"]
+        self.temp_figure = chart["figure"]
+        self.temp_plot = chart["plot"]
+        self.temp_auto_locator = chart["auto_locator"]
+        self.temp_hour_locator = chart["hour_locator"]
+        self.temp_line = chart["line"]
+        self.temp_canvas = chart["canvas"]
+        self.temp_canvas_widget = chart["canvas_widget"]
+        self.temp_toolbar = chart["toolbar"]
+        self.temp_blit = chart["blit"]
         
         # Store original axis limits for zoom functionality
         self.temp_original_xlim = None
         self.temp_original_ylim = None
         
-        # Create canvas with navigation toolbar
-        self.temp_canvas = FigureCanvasTkAgg(self.temp_figure, master=chart_frame)
-        self.temp_canvas_widget = self.temp_canvas.get_tk_widget()
-        self.temp_canvas_widget.grid(row=0, column=0, sticky="nsew")
-        
-        # Add navigation toolbar for additional zoom/pan functionality
-        toolbar_frame = ttk.Frame(chart_frame)
-        toolbar_frame.grid(row=2, column=0, sticky="ew", pady=2)
-        self.temp_toolbar = NavigationToolbar2Tk(self.temp_canvas, toolbar_frame)
-        self.temp_toolbar.update()
-        
         # Bind changes to auto-update
-        self.temp_timerange_var.trace_add("write", lambda *args: self.update_temperature_chart())
+        self.temp_timerange_var.trace_add("write", lambda *args: self.update_temperature_chart(rescale=True))
 
     def setup_humidity_chart(self, parent):
         """Set up the humidity chart with pause/zoom functionality"""
+        chart = self._setup_series_chart(
+            parent, "Humidity Over Time", "Drone Humidity Readings", "Humidity (%)",
+            color='#3498DB', label="Humidity", bootstyle="info",
+            on_pause=self.toggle_humidity_pause, on_zoom=self.zoom_humidity_chart, on_reset=self.reset_humidity_zoom)
+        
+        self.humidity_timerange_var = chart["timerange_var"]
+        self.humidity_pause_btn = chart["pause_btn"]
+        self.humidity_figure = chart["figure"]
+        self.humidity_plot = chart["plot"]
+        self.humidity_auto_locator = chart["auto_locator"]
+        self.humidity_hour_locator = chart["hour_locator"]
+        self.humidity_line = chart["line"]
+        self.humidity_canvas = chart["canvas"]
+        self.humidity_canvas_widget = chart["canvas_widget"]
+        self.humidity_toolbar = chart["toolbar"]
+        self.humidity_blit = chart["blit"]
+        
+        # Store original axis limits for zoom functionality
+        self.humidity_original_xlim = None
+        self.humidity_original_ylim = None
+        
+        # Bind changes to auto-update
+        self.humidity_timerange_var.trace_add("write", lambda *args: self.update_humidity_chart(rescale=True))
+
+    def _setup_series_chart(self, parent, frame_title, plot_title, ylabel, color, label, bootstyle,
+                            on_pause, on_zoom, on_reset):
+        """Build the frame, controls, figure, animated line, canvas and toolbar shared by both charts
+
+        Args:
+            parent: Tab frame the chart is placed in
+            frame_title: Text of the surrounding label frame
+            plot_title: Initial axes title
+            ylabel: Y-axis label
+            color: Line color
+            label: Line label
+            bootstyle: ttkbootstrap style of the label frame
+            on_pause: Pause/Resume button callback
+            on_zoom: Zoom callback, called with the zoom factor
+            on_reset: Reset Zoom button callback
+
+        Returns:
+            Dict of the chart handles ("timerange_var", "pause_btn", "figure", "plot",
+            "auto_locator", "hour_locator", "line", "canvas", "canvas_widget", "toolbar", "blit")
+        """
         # Create frame for chart with padding
         if USING_BOOTSTRAP:
-            chart_frame = ttk.Labelframe(parent, text="Humidity Over Time", padding=10, bootstyle="info")
+            chart_frame = ttk.Labelframe(parent, text=frame_title, padding=10, bootstyle=bootstyle)
         else:
-            chart_frame = ttk.LabelFrame(parent, text="Humidity Over Time", padding=10)
+            chart_frame = ttk.LabelFrame(parent, text=frame_title, padding=10)
             
         chart_frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
         
@@ -237,50 +547,70 @@ class ServerGUI:
         
         # Add time range selector
         ttk.Label(control_frame, text="Time Range:").pack(side="left", padx=5)
-        self.humidity_timerange_var = tk.StringVar(value="Last Hour")
-        timerange_combo = ttk.Combobox(control_frame, textvariable=self.humidity_timerange_var, 
+        timerange_var = tk.StringVar(value="Last Hour")
+        timerange_combo = ttk.Combobox(control_frame, textvariable=timerange_var, 
                                     values=["Last Hour", "Last 12 Hours", "Last 24 Hours", "All Data"])
         timerange_combo.pack(side="left", padx=5)
         
         # Add pause/resume button
-        self.humidity_paused = False
-        self.humidity_pause_btn = ttk.Button(control_frame, text="Pause", 
-                                        command=self.toggle_humidity_pause)
-        self.humidity_pause_btn.pack(side="left", padx=10)
+        pause_btn = ttk.Button(control_frame, text="Pause", command=on_pause)
+        pause_btn.pack(side="left", padx=10)
         
         # Add zoom controls
         ttk.Button(control_frame, text="Zoom In", 
-                command=lambda: self.zoom_humidity_chart(0.8)).pack(side="left", padx=2)
+                command=lambda: on_zoom(0.8)).pack(side="left", padx=2)
         ttk.Button(control_frame, text="Zoom Out", 
-                command=lambda: self.zoom_humidity_chart(1.25)).pack(side="left", padx=2)
+                command=lambda: on_zoom(1.25)).pack(side="left", padx=2)
         ttk.Button(control_frame, text="Reset Zoom", 
-                command=self.reset_humidity_zoom).pack(side="left", padx=2)
-        
-        # Create matplotlib figure
-        self.humidity_figure = Figure(figsize=(6, 4), dpi=100)
-        self.humidity_plot = self.humidity_figure.add_subplot(111)
-        self.humidity_plot.set_title("Drone Humidity Readings")
-        self.humidity_plot.set_xlabel("Time")
-        self.humidity_plot.set_ylabel("Humidity (%)")
-        self.humidity_plot.grid(True)
-        
-        # Store original axis limits for zoom functionality
-        self.humidity_original_xlim = None
-        self.humidity_original_ylim = None
+                command=on_reset).pack(side="left", padx=2)
+        
+        # Create matplotlib figure; constrained layout is solved during full draws only,
+        # so blitted updates no longer pay for a tight_layout pass
+        figure = Figure(figsize=(6, 4), dpi=100, constrained_layout=True)
+        plot = figure.add_subplot(111)
+        plot.set_title(plot_title)
+        plot.set_xlabel("Time")
+        plot.set_ylabel(ylabel)
+        plot.grid(True)
+        plot.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+        plot.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f"{x:.1f}"))
+        
+        # Tick locators are created once and swapped when the number of points changes
+        auto_locator = mdates.AutoDateLocator()
+        hour_locator = mdates.HourLocator(interval=1)
+        plot.xaxis.set_major_locator(auto_locator)
+        
+        # Single animated line updated in place with set_data and blitted on refresh
+        (line,) = plot.plot([], [], animated=True, marker='o', linestyle='-', markersize=5,
+                            color=color, label=label)
         
         # Create canvas with navigation toolbar
-        self.humidity_canvas = FigureCanvasTkAgg(self.humidity_figure, master=chart_frame)  
-        self.humidity_canvas_widget = self.humidity_canvas.get_tk_widget()
-        self.humidity_canvas_widget.grid(row=0, column=0, sticky="nsew")
+        canvas = FigureCanvasTkAgg(figure, master=chart_frame)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.grid(row=0, column=0, sticky="nsew")
         
         # Add navigation toolbar for additional zoom/pan functionality
         toolbar_frame = ttk.Frame(chart_frame)
         toolbar_frame.grid(row=2, column=0, sticky="ew", pady=2)
-        self.humidity_toolbar = NavigationToolbar2Tk(self.humidity_canvas, toolbar_frame)
-        self.humidity_toolbar.update()
-        
-        # Bind changes to auto-update
-        self.humidity_timerange_var.trace_add("write", lambda *args: self.update_humidity_chart())
+        toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
+        toolbar.update()
+        
+        # Background is captured on the first full draw and after every layout change
+        blit = BlitManager(canvas, plot, [line])
+        
+        return {
+            "timerange_var": timerange_var,
+            "pause_btn": pause_btn,
+            "figure": figure,
+            "plot": plot,
+            "auto_locator": auto_locator,
+            "hour_locator": hour_locator,
+            "line": line,
+            "canvas": canvas,
+            "canvas_widget": canvas_widget,
+            "toolbar": toolbar,
+            "blit": blit
+        }
 
     # Pause/Resume functionality methods
     def toggle_temp_pause(self):
@@ -326,7 +656,7 @@ class ServerGUI:
         self.temp_plot.set_ylim(y_center - y_range, y_center + y_range)
         
         # Redraw canvas
-        self.temp_canvas.draw()
+        self.temp_canvas.draw_idle()
 
     def zoom_humidity_chart(self, factor):
         """Zoom humidity chart by the given factor"""
@@ -346,7 +676,7 @@ class ServerGUI:
         self.humidity_plot.set_ylim(y_center - y_range, y_center + y_range)
         
         # Redraw canvas
-        self.humidity_canvas.draw()
+        self.humidity_canvas.draw_idle()
 
     def reset_temp_zoom(self):
         """Reset temperature chart zoom to show all data"""
@@ -355,7 +685,7 @@ class ServerGUI:
             self.temp_plot.set_ylim(self.temp_original_ylim)
         else:
             self.temp_plot.autoscale()
-        self.temp_canvas.draw()
+        self.temp_canvas.draw_idle()
 
     def reset_humidity_zoom(self):
         """Reset humidity chart zoom to show all data"""
@@ -364,226 +694,354 @@ class ServerGUI:
             self.humidity_plot.set_ylim(self.humidity_original_ylim)
         else:
             self.humidity_plot.autoscale()
-        self.humidity_canvas.draw()
+        self.humidity_canvas.draw_idle()
 
     def filter_chart_data(self, timerange):
-        """Filter chart data based on the selected time range"""
-        now = datetime.datetime.now()
-        
-        # Create empty result structure
-        result = {
-            "timestamps": [],
-            "temperature": [],
-            "humidity": []
+        """Filter chart data based on the selected time range
+
+        The result is cached until new data arrives, so the temperature and humidity
+        charts share one filtering pass when they use the same time range.
+
+        Returns:
+            Dict of NumPy arrays ("timestamps", "temperature", "humidity") in chronological
+            order; the arrays may be shared between callers and must not be modified
+        """
+        key = (timerange, self._buf_version)
+        if self._filter_cache is not None and self._filter_cache[0] == key:
+            return self._filter_cache[1]
+        
+        # Define cutoff time based on selected time range, in the buffer's datetime64 units
+        span = CHART_TIMERANGES.get(timerange)  # None for "All Data"
+        cutoff = None if span is None else np.datetime64(datetime.datetime.now(), 'ms') - span
+        
+        # Gather the buffers oldest-first (only the Tk thread touches them, so no lock)
+        n = self._buf_len
+        head = self._buf_head
+        
+        # Points arrive in time order, so the ring holds two sorted runs: the older
+        # one from head to the end (once the buffer has wrapped) and the newer one
+        # before head. The cutoff is found by binary search over the runs in place,
+        # and only the slice after it is copied
+        start = 0
+        if cutoff is not None:
+            older = self._ts_buf[head:] if n == CHART_MAX_POINTS else self._ts_buf[:0]
+            start = np.searchsorted(older, cutoff)
+            if start == len(older):
+                start += np.searchsorted(self._ts_buf[:head], cutoff)
+        order = (np.arange(start, n) + head - n) % CHART_MAX_POINTS
+        
+        data = {
+            "timestamps": self._ts_buf[order],
+            "temperature": self._temp_buf[order],
+            "humidity": self._hum_buf[order]
         }
-        
-        # If no data, return empty result
-        if not self.chart_data["timestamps"]:
-            return result
-        
-        # Define cutoff time based on selected time range
-        if timerange == "Last Hour":
-            cutoff = now - datetime.timedelta(hours=1)
-        elif timerange == "Last 12 Hours":
-            cutoff = now - datetime.timedelta(hours=12)
-        elif timerange == "Last 24 Hours":
-            cutoff = now - datetime.timedelta(hours=24)
-        else:  # All Data
-            cutoff = datetime.datetime.min
-        
-        # Process timestamps to datetime objects
-        valid_indices = []
-        for i, ts in enumerate(self.chart_data["timestamps"]):
-            try:
-                # Convert timestamp string to datetime object
-                if isinstance(ts, datetime.datetime):
-                    dt = ts
-                elif 'T' in ts:
-                    # ISO format handling
-                    if ts.endswith('Z'):
-                        dt = datetime.datetime.strptime(ts[:-1], "%Y-%m-%dT%H:%M:%S")
-                    else:
-                        dt = datetime.datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S")
-                else:
-                    # Try a simpler format
-                    dt = datetime.datetime.strptime(ts, "%Y-%m-%d %H:%M:%S")
-                
-                # Include data point if it's after the cutoff time
-                if dt >= cutoff:
-                    valid_indices.append(i)
-                    result["timestamps"].append(dt)
-                
-            except (ValueError, TypeError) as e:
-                print(f"Error parsing timestamp '{ts}': {e}")
-        
-        # Extract temperature and humidity data for valid indices
-        for i in valid_indices:
-            if i < len(self.chart_data["temperature"]):
-                result["temperature"].append(self.chart_data["temperature"][i])
-            if i < len(self.chart_data["humidity"]):
-                result["humidity"].append(self.chart_data["humidity"][i])
-        
-        return result
-
-    def update_temperature_chart(self):
-        """Update the temperature chart with current data (respects pause state)"""
+        self._filter_cache = (key, data)
+        return data
+
+    def _parse_chart_timestamp(self, ts):
+        """Convert a drone timestamp (ISO string with optional 'Z', or datetime) to a naive local datetime"""
+        if isinstance(ts, datetime.datetime):
+            return ts
+        # Drones send local time with a literal 'Z' suffix, so it is dropped rather than
+        # treated as UTC; fromisoformat is several times faster than strptime and also
+        # accepts the space-separated and fractional-second variants
+        dt = datetime.datetime.fromisoformat(ts[:-1] if ts.endswith('Z') else ts)
+        if dt.tzinfo is not None:
+            # Genuine UTC offsets are converted to local time to match the rest of the chart
+            dt = dt.astimezone().replace(tzinfo=None)
+        return dt
+
+    def _downsample_minmax(self, timestamps, values, n_out):
+        """Reduce a series to at most about n_out points, keeping each bucket's extremes
+
+        Args:
+            timestamps: Chronologically ordered timestamps
+            values: Values matching timestamps (NaN marks a missing value)
+            n_out: Target number of points, e.g. twice the plot width in pixels
+
+        Returns:
+            Tuple (timestamps, values); the input arrays if no reduction is needed
+        """
+        # Unmapped widgets report a width of 1, so tiny targets mean "not laid out yet"
+        if n_out < 4 or len(values) <= n_out:
+            return timestamps, values
+        
+        # Gaps are not visible at this density, so missing values are dropped before bucketing
+        valid = ~np.isnan(values)
+        if not valid.all():
+            timestamps, values = timestamps[valid], values[valid]
+        n = len(values)
+        if n <= n_out:
+            return timestamps, values
+        
+        # Split into equal buckets (the last one padded with its final value) and keep
+        # the position of the minimum and maximum of each, in time order
+        buckets = n_out // 2
+        size = -(-n // buckets)
+        padded = np.empty(buckets * size, dtype=values.dtype)
+        padded[:n] = values
+        padded[n:] = values[-1]
+        grid = padded.reshape(buckets, size)
+        base = np.arange(buckets) * size
+        picks = np.sort(np.stack((base + grid.argmin(axis=1), base + grid.argmax(axis=1)), axis=1), axis=1)
+        
+        # Always keep the endpoints so the data limits match the full series
+        idx = np.unique(np.concatenate(([0], np.minimum(picks.ravel(), n - 1), [n - 1])))
+        return timestamps[idx], values[idx]
+
+    def _add_time_headroom(self, ax):
+        """Extend the x-axis past the newest point so new data does not force a full redraw every time"""
+        xmin, xmax = ax.get_xlim()
+        ax.set_xlim(xmin, xmax + (xmax - xmin) * CHART_TIME_HEADROOM, auto=None)
+
+    def _outside_view(self, ax, dates, values):
+        """Check whether the current axis limits no longer fit the data
+
+        Returns:
+            True if any point falls outside the view, or the data covers so little of
+            the time axis (e.g. the view was fitted to a single point) that it should be refitted
+        """
+        xmin, xmax = ax.get_xlim()
+        ymin, ymax = ax.get_ylim()
+        # Dates are in chronological order; missing values (NaN) are ignored
+        first, last = mdates.date2num(dates[0]), mdates.date2num(dates[-1])
+        if first < xmin or last > xmax or np.nanmin(values) < ymin or np.nanmax(values) > ymax:
+            return True
+        return (last - first) < (xmax - xmin) * 0.5
+
+    def update_temperature_chart(self, rescale=False):
+        """Update the temperature chart with current data (respects pause state)
+
+        Args:
+            rescale: Force the axes to be refitted to the data (e.g. after the time range changes)
+        """
         # Don't update if paused
         if hasattr(self, 'temp_paused') and self.temp_paused:
             return
         
-        # Clear the plot
-        self.temp_plot.clear()
-        
         # Get selected time range
         selected_timerange = self.temp_timerange_var.get()
         
         # Get filtered data based on time range
         filtered_data = self.filter_chart_data(selected_timerange)
         
-        if not filtered_data["timestamps"] or not filtered_data["temperature"]:
-            # No data to display
-            self.temp_plot.set_title("No Temperature Data Available")
-            self.temp_canvas.draw()
-            return
-        
         # Get the dates from filtered data
         dates = filtered_data["timestamps"]
         
-        # Filter out None values
-        valid_points = [(dates[i], val) for i, val in enumerate(filtered_data["temperature"]) 
-                        if val is not None]
+        # Missing values stay in place as NaN and are drawn as gaps in the line
+        values = filtered_data["temperature"]
         
-        if not valid_points:
-            self.temp_plot.set_title("No Valid Temperature Data")
-            self.temp_canvas.draw()
+        if not len(dates) or np.isnan(values).all():
+            # No data to display; the title change needs a full redraw
+            title = "No Temperature Data Available" if not len(dates) else "No Valid Temperature Data"
+            self.temp_line.set_data([], [])
+            if self.temp_plot.get_title() != title:
+                self.temp_plot.set_title(title)
+                self.temp_canvas.draw_idle()
             return
         
-        # Unpack the valid points
-        plot_dates, plot_values = zip(*valid_points)
-        
-        # Plot the temperature data
-        self.temp_plot.plot(plot_dates, plot_values, 
-                        marker='o', linestyle='-', markersize=5, 
-                        color='#FF5733', label="Temperature")
-        
-        # Format the plot
-        self.temp_plot.set_title("Temperature Over Time")
-        self.temp_plot.set_xlabel("Time")
-        self.temp_plot.set_ylabel("Temperature (°C)")
-        self.temp_plot.grid(True)
-        
-        # Store original limits for zoom reset (only if not already stored)
-        if self.temp_original_xlim is None:
-            self.temp_original_xlim = self.temp_plot.get_xlim()
-            self.temp_original_ylim = self.temp_plot.get_ylim()
-        
-        # Format date on x-axis
-        self.temp_plot.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-        
-        # Set appropriate time interval on x-axis
-        if len(dates) > 20:
-            self.temp_plot.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-        
-        # Format y-axis with 1 decimal place
-        self.temp_plot.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"{x:.1f}"))
-        
-        # Adjust layout and redraw
-        self.temp_figure.tight_layout()
-        self.temp_canvas.draw()
+        # Update the existing line in place, downsampled to about two points per
+        # pixel column since anything denser is not visible
+        n_out = 2 * self.temp_canvas_widget.winfo_width()
+        self.temp_line.set_data(*self._downsample_minmax(dates, values, n_out))
+        
+        # A full draw is only needed when the title or the axis limits change;
+        # otherwise the cached background is restored and only the line is blitted
+        title_changed = self.temp_plot.get_title() != "Temperature Over Time"
+        if rescale or title_changed or self._outside_view(self.temp_plot, dates, values):
+            if title_changed:
+                self.temp_plot.set_title("Temperature Over Time")
+            self.temp_plot.relim()
+            self.temp_plot.autoscale(enable=True)
+            self._add_time_headroom(self.temp_plot)
+            
+            # Store original limits for zoom reset (only if not already stored)
+            if self.temp_original_xlim is None:
+                self.temp_original_xlim = self.temp_plot.get_xlim()
+                self.temp_original_ylim = self.temp_plot.get_ylim()
+            
+            # Set appropriate time interval on x-axis
+            locator = self.temp_hour_locator if len(dates) > 20 else self.temp_auto_locator
+            if self.temp_plot.xaxis.get_major_locator() is not locator:
+                self.temp_plot.xaxis.set_major_locator(locator)
+            
+            # Redraw; the draw event recaptures the blit background
+            self.temp_canvas.draw_idle()
+        else:
+            self.temp_blit.update()
+
+    def update_humidity_chart(self, rescale=False):
+        """Update the humidity chart with current data (respects pause state)
 
-    def update_humidity_chart(self):
-        """Update the humidity chart with current data (respects pause state)"""
+        Args:
+            rescale: Force the axes to be refitted to the data (e.g. after the time range changes)
+        """
         # Don't update if paused
         if hasattr(self, 'humidity_paused') and self.humidity_paused:
             return
         
-        # Clear the plot
-        self.humidity_plot.clear()
-        
         # Get selected time range
         selected_timerange = self.humidity_timerange_var.get()
         
         # Get filtered data based on time range
         filtered_data = self.filter_chart_data(selected_timerange)
         
-        if not filtered_data["timestamps"] or not filtered_data["humidity"]:
-            # No data to display
-            self.humidity_plot.set_title("No Humidity Data Available")
-            self.humidity_canvas.draw()
-            return
-        
         # Get the dates from filtered data
         dates = filtered_data["timestamps"]
         
-        # Filter out None values
-        valid_points = [(dates[i], val) for i, val in enumerate(filtered_data["humidity"]) 
-                        if val is not None]
+        # Missing values stay in place as NaN and are drawn as gaps in the line
+        values = filtered_data["humidity"]
         
-        if not valid_points:
-            self.humidity_plot.set_title("No Valid Humidity Data")
-            self.humidity_canvas.draw()
+        if not len(dates) or np.isnan(values).all():
+            # No data to display; the title change needs a full redraw
+            title = "No Humidity Data Available" if not len(dates) else "No Valid Humidity Data"
+            self.humidity_line.set_data([], [])
+            if self.humidity_plot.get_title() != title:
+                self.humidity_plot.set_title(title)
+                self.humidity_canvas.draw_idle()
             return
         
-        # Unpack the valid points
-        plot_dates, plot_values = zip(*valid_points)
-        
-        # Plot the humidity data
-        self.humidity_plot.plot(plot_dates, plot_values, 
-                            marker='o', linestyle='-', markersize=5, 
-                            color='#3498DB', label="Humidity")
-        
-        # Format the plot
-        self.humidity_plot.set_title("Humidity Over Time")
-        self.humidity_plot.set_xlabel("Time")
-        self.humidity_plot.set_ylabel("Humidity (%)")
-        self.humidity_plot.grid(True)
-        
-        # Store original limits for zoom reset (only if not already stored)
-        if self.humidity_original_xlim is None:
-            self.humidity_original_xlim = self.humidity_plot.get_xlim()
-            self.humidity_original_ylim = self.humidity_plot.get_ylim()
+        # Update the existing line in place, downsampled to about two points per
+        # pixel column since anything denser is not visible
+        n_out = 2 * self.humidity_canvas_widget.winfo_width()
+        self.humidity_line.set_data(*self._downsample_minmax(dates, values, n_out))
+        
+        # A full draw is only needed when the title or the axis limits change;
+        # otherwise the cached background is restored and only the line is blitted
+        title_changed = self.humidity_plot.get_title() != "Humidity Over Time"
+        if rescale or title_changed or self._outside_view(self.humidity_plot, dates, values):
+            if title_changed:
+                self.humidity_plot.set_title("Humidity Over Time")
+            self.humidity_plot.relim()
+            self.humidity_plot.autoscale(enable=True)
+            self._add_time_headroom(self.humidity_plot)
+            
+            # Store original limits for zoom reset (only if not already stored)
+            if self.humidity_original_xlim is None:
+                self.humidity_original_xlim = self.humidity_plot.get_xlim()
+                self.humidity_original_ylim = self.humidity_plot.get_ylim()
+            
+            # Set appropriate time interval on x-axis
+            locator = self.humidity_hour_locator if len(dates) > 20 else self.humidity_auto_locator
+            if self.humidity_plot.xaxis.get_major_locator() is not locator:
+                self.humidity_plot.xaxis.set_major_locator(locator)
+            
+            # Redraw; the draw event recaptures the blit background
+            self.humidity_canvas.draw_idle()
+        else:
+            self.humidity_blit.update()
+
+    # Modified add_data_to_charts method
+    def add_data_to_charts(self, reading):
+        """Add new data point to chart data storage"""
+        # A message with neither temperature nor humidity has nothing to plot,
+        # so it is dropped before any parsing or locking
+        temperature = reading.temperature
+        humidity = reading.humidity
+        if temperature is None and humidity is None:
+            return
         
-        # Format date on x-axis
-        self.humidity_plot.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+        # Use the message timestamp (or received_at) if available, otherwise the current time
+        timestamp = reading.timestamp or datetime.datetime.now().isoformat()
         
-        # Set appropriate time interval on x-axis
-        if len(dates) > 20:
-            self.humidity_plot.xaxis.set_major_locator(mdates.HourLocator(interval=1))
+        # Parse the timestamp once here instead of on every chart refresh
+        try:
+            ts = np.datetime64(self._parse_chart_timestamp(timestamp), 'ms')
+        except (ValueError, TypeError) as e:
+            print(f"Error parsing timestamp '{timestamp}': {e}")
+            return
         
-        # Format y-axis with 1 decimal place
-        self.humidity_plot.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"{x:.1f}"))
+        # Hand the point to the Tk thread without blocking; it is stored and drawn
+        # on the next coalesced refresh instead of once per data point
+        self._incoming.put((ts, temperature, humidity))
         
-        # Adjust layout and redraw
-        self.humidity_figure.tight_layout()
-        self.humidity_canvas.draw()
+        # The refresh clears the flag before draining, so a point queued after the
+        # drain always finds the flag cleared and schedules another refresh
+        if not self._chart_refresh_pending:
+            self._chart_refresh_pending = True
+            self.root.after(CHART_REFRESH_MS, self._do_chart_refresh)
+
+    def _drain_chart_queue(self):
+        """Move queued points into the ring buffers and mark unpaused charts dirty (Tk thread only)"""
+        count = 0
+        while True:
+            try:
+                ts, temperature, humidity = self._incoming.get_nowait()
+            except queue.Empty:
+                break
+            # Write into the ring buffers; once full, the oldest point is overwritten in O(1)
+            i = self._buf_head
+            self._ts_buf[i] = ts
+            self._temp_buf[i] = np.nan if temperature is None else temperature
+            self._hum_buf[i] = np.nan if humidity is None else humidity
+            self._buf_head = (i + 1) % CHART_MAX_POINTS
+            count += 1
+        
+        if count:
+            self._buf_len = min(self._buf_len + count, CHART_MAX_POINTS)
+            self._buf_version += 1
+            if not self.temp_paused:
+                self._temp_dirty = True
+            if not self.humidity_paused:
+                self._humidity_dirty = True
+
+    def _do_chart_refresh(self):
+        """Redraw the visible charts that received data since the last refresh (runs on the Tk thread)
+
+        Hidden charts keep their dirty flag and are redrawn by _on_tab_changed once shown.
+        Charts redrawn less than CHART_MIN_REDRAW_INTERVAL ago also stay dirty, and a
+        trailing refresh is scheduled for when the interval ends so the newest data is drawn.
+        """
+        self._chart_refresh_pending = False
+        self._drain_chart_queue()
+        
+        now = time.monotonic()
+        temp_wait = self._temp_last_draw + CHART_MIN_REDRAW_INTERVAL - now
+        humidity_wait = self._humidity_last_draw + CHART_MIN_REDRAW_INTERVAL - now
+        temp_dirty = self._temp_dirty and self._chart_visible(self.temp_tab)
+        humidity_dirty = self._humidity_dirty and self._chart_visible(self.humidity_tab)
+        
+        # Throttled charts are deferred to a single trailing refresh
+        waits = []
+        if temp_dirty and temp_wait > 0:
+            temp_dirty = False
+            waits.append(temp_wait)
+        if humidity_dirty and humidity_wait > 0:
+            humidity_dirty = False
+            waits.append(humidity_wait)
+        if waits:
+            self._chart_refresh_pending = True
+            self.root.after(max(1, int(min(waits) * 1000)), self._do_chart_refresh)
+        
+        if temp_dirty:
+            self._temp_dirty = False
+        if humidity_dirty:
+            self._humidity_dirty = False
+        
+        if temp_dirty:
+            self._temp_last_draw = now
+            self.update_temperature_chart()
+        if humidity_dirty:
+            self._humidity_last_draw = now
+            self.update_humidity_chart()
+
+    def _chart_visible(self, chart_tab):
+        """Check whether the Charts tab and the given chart sub-tab are both selected"""
+        return (self.charts_built
+                and self.notebook.select() == str(self.charts_tab)
+                and self.charts_notebook.select() == str(chart_tab))
+
+    def _on_tab_changed(self, event):
+        """Redraw a chart that went stale while hidden as soon as it becomes visible"""
+        if not self.charts_built:
+            if self.notebook.select() != str(self.charts_tab):
+                return
+            self._build_charts()
+        stale = self._temp_dirty or self._humidity_dirty
+        if stale and not self._chart_refresh_pending:
+            self._chart_refresh_pending = True
+            self.root.after_idle(self._do_chart_refresh)
 
-    # Modified add_data_to_charts method
-    def add_data_to_charts(self, drone_data):
-        """Add new data point to chart data storage"""
-        with self.update_lock:
-            # Extract timestamp - use received_at if available, otherwise use current time
-            timestamp = drone_data.get("timestamp", drone_data.get("received_at", datetime.datetime.now().isoformat()))
-            
-            # Extract temperature and humidity
-            temperature = drone_data.get("average_temperature")
-            humidity = drone_data.get("average_humidity")
-            
-            # Add data to chart data storage
-            self.chart_data["timestamps"].append(timestamp)
-            self.chart_data["temperature"].append(temperature)
-            self.chart_data["humidity"].append(humidity)
-            
-            # Limit data points to prevent memory issues (keep last 1000 points)
-            if len(self.chart_data["timestamps"]) > 1000:
-                self.chart_data["timestamps"].pop(0)
-                self.chart_data["temperature"].pop(0)
-                self.chart_data["humidity"].pop(0)
-        
-        # Update charts if not paused
-        if not getattr(self, 'temp_paused', False):
-            self.root.after(0, self.update_temperature_chart)
-        if not getattr(self, 'humidity_paused', False):
-            self.root.after(0, self.update_humidity_chart)
     def setup_drone_status_panel(self, parent):        
         # Create frame with label and padding
         if USING_BOOTSTRAP:
@@ -671,8 +1129,9 @@ class ServerGUI:
         self.anomaly_table.column("timestamp", width=150, anchor="center")
         
         # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(anomaly_frame, orient="vertical", command=self.anomaly_table.yview)
-        self.anomaly_table.configure(yscrollcommand=y_scrollbar.set)
+        # Only the visible rows exist in the Treeview; the scrollbar moves over the full history
+        y_scrollbar = ttk.Scrollbar(anomaly_frame, orient="vertical")
+        self.anomaly_view = VirtualTable(self.anomaly_table, y_scrollbar, maxlen=100)
         
         x_scrollbar = ttk.Scrollbar(anomaly_frame, orient="horizontal", command=self.anomaly_table.xview)
         self.anomaly_table.configure(xscrollcommand=x_scrollbar.set)
@@ -734,8 +1193,9 @@ class ServerGUI:
         self.data_logs_table.column("status", width=150, anchor="center")        
         
         # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(data_logs_frame, orient="vertical", command=self.data_logs_table.yview)
-        self.data_logs_table.configure(yscrollcommand=y_scrollbar.set)
+        # Only the visible rows exist in the Treeview; the scrollbar moves over the full history
+        y_scrollbar = ttk.Scrollbar(data_logs_frame, orient="vertical")
+        self.data_logs_view = VirtualTable(self.data_logs_table, y_scrollbar, maxlen=1000)
         
         x_scrollbar = ttk.Scrollbar(data_logs_frame, orient="horizontal", command=self.data_logs_table.xview)
         self.data_logs_table.configure(xscrollcommand=x_scrollbar.set)
@@ -834,20 +1294,53 @@ class ServerGUI:
             
         exit_btn.pack(side=tk.RIGHT, padx=10)
 
-    def log(self, message, level='info'):        
-        # Schedule GUI update to be thread-safe
-        self.root.after(0, self._update_log, message, level)
+    def _now_strings(self):
+        """Return the current local time as ("%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ") strings
 
-    def _update_log(self, message, level):        
+        Both are formatted once per second and reused by every caller within that second.
+        The cache is replaced as a single tuple, so network threads can call this too.
+        """
+        sec = int(time.time())
+        cached_sec, clock, iso = self._ts_cache
+        if sec != cached_sec:
+            local = time.localtime(sec)
+            clock = time.strftime("%H:%M:%S", local)
+            iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", local)
+            self._ts_cache = (sec, clock, iso)
+        return clock, iso
+
+    def log(self, message, level='info', args=()):        
+        # Queue for the next batched flush on the Tk thread (thread-safe, no Tk event per line).
+        # With args, the message is a %-format string that is only formatted if the line is shown
+        self._message_queue.append((message, level, args))
+
+    def _update_log(self, messages):        
         # Get current time for timestamp
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        stamp = f"[{self._now_strings()[0]}] "
+        
+        # Lines beyond the cap would be trimmed right away, so they are not inserted
+        if len(messages) > LOG_MAX_LINES:
+            messages = messages[-LOG_MAX_LINES:]
         
         # Enable editing
         self.log_text.config(state=tk.NORMAL)
         
-        # Insert timestamp and message
-        self.log_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        self.log_text.insert(tk.END, f"{message}\n", level)
+        # Insert timestamp and message for every queued line in a single call;
+        # Text.insert takes any number of (text, tags) pairs
+        chunks = []
+        for message, level, args in messages:
+            if args:
+                message = message % args
+            chunks += (stamp, "timestamp", f"{message}\n", level)
+            self._log_lines += message.count("\n") + 1
+        self.log_text.insert(tk.END, *chunks)
+        
+        # Drop the oldest lines in one chunk so the widget stays bounded; a large batch
+        # can overshoot the cap by more than LOG_TRIM_LINES, so trim the whole excess
+        if self._log_lines > LOG_MAX_LINES:
+            excess = self._log_lines - LOG_MAX_LINES + LOG_TRIM_LINES
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines -= excess
         
         # Auto-scroll to end
         self.log_text.see(tk.END)
@@ -856,48 +1349,48 @@ class ServerGUI:
         self.log_text.config(state=tk.DISABLED)
 
     def update_server_status(self, status, active_connection_count):        
-        # Schedule GUI update to be thread-safe
-        self.root.after(0, self._update_status_display, status, active_connection_count)
+        # Keep only the latest status for the next batched flush (thread-safe, no Tk event per call)
+        self._server_status_pending = (status, active_connection_count)
 
     def _update_status_display(self, status, active_connection_count):        
-        # Update status label text
-        self.status_label.config(text=status)
-        
-        # Update style based on status
-        if USING_BOOTSTRAP:
-            if status == "Running":
-                self.status_label.configure(bootstyle="success")
-            elif status == "Stopped":
-                self.status_label.configure(bootstyle="danger")
-            elif status == "Error":
-                self.status_label.configure(bootstyle="warning")
-            else:
-                self.status_label.configure(bootstyle="info")
+        # Only touch the label (and the ttkbootstrap style engine) when the status changes
+        if status != self._last_status:
+            self._last_status = status
+            
+            # Update status label text
+            self.status_label.config(text=status)
+            
+            # Update style based on status
+            if USING_BOOTSTRAP:
+                self.status_label.configure(bootstyle=self._STATUS_STYLE.get(status, "info"))
         
         # Update connection count
-        self.connection_count.config(text=str(active_connection_count))
+        if active_connection_count != self._last_connection_count:
+            self._last_connection_count = active_connection_count
+            self.connection_count.config(text=str(active_connection_count))
+
+    def add_data_entry(self, reading):
+        """Record a drone reading and queue its table, status and chart updates
 
-    def add_data_entry(self, drone_data):
+        Returns:
+            The drone's resulting status, as stored in drone_statuses
+        """
         # Store data and update UI in a thread-safe way
         with self.update_lock:
-            # Store data (up to 1000 entries)
-            self.drone_data.append(drone_data)
-            if len(self.drone_data) > 1000:
-                self.drone_data.pop(0)
+            # Store data (the deque keeps the latest 1000 entries)
+            self.drone_data.append(reading)
 
         # Extract drone identification
-        drone_id = drone_data.get("drone_id", "unknown")
+        drone_id = reading.drone_id or "unknown"
 
         # Always log data reception
-        self.log(f"Received data from {drone_id}", "info")
+        self.log("Received data from %s", "info", (drone_id,))
 
         # Extract relevant data
-        battery = drone_data.get("battery_level", 0)
-        temperature = drone_data.get("average_temperature", 0)
-        humidity = drone_data.get("average_humidity", 0)
+        battery = reading.battery
 
         # Get raw status from data
-        raw_status = drone_data.get("status", "Connected")
+        raw_status = reading.status
 
         # Check for special status values BEFORE standardizing format
         if raw_status.lower() == "returning_to_base" or raw_status.lower() == "returning to base":
@@ -907,23 +1400,18 @@ class ServerGUI:
         # Only standardize if not already handled by special cases
         else:
             # Standardize status format (convert snake_case to Title Case)
-            if "_" in raw_status:
-                status = " ".join(word.capitalize() for word in raw_status.split("_"))
-            else:
-                status = raw_status        
+            status = _prettify(raw_status)
 
         # Handle low battery status (unless already in a special status)
-        if battery < 20 and status not in ["Returning To Base", "Charging"]:
+        if battery < 20 and status not in INACTIVE_STATUSES:
             status = "Returning To Base"
             self.log(f"Drone {drone_id} is low on battery ({battery:.1f}%) - Returning to Base", "warning")
 
         # Check for status change and log appropriately
-        old_status = None
-        if drone_id in self.drone_statuses:
-            old_status = self.drone_statuses[drone_id].get("status")
+        old_status = self.drone_statuses.get(drone_id, NO_STATUS).status
 
         # Now that we have the final status determination, update the drone status in memory
-        self.update_drone_status(drone_id, status, battery, temperature, humidity)
+        self.update_drone_status(drone_id, status, battery, reading.temperature, reading.humidity)
 
         # Only log status changes, not repeats
         if old_status is not None and old_status != status:
@@ -931,98 +1419,98 @@ class ServerGUI:
                     "warning" if status in ["Returning To Base"] else
                     "success" if status == "Charging" else "info")
 
-        # Update data logs table                
-        self.root.after(0, self._update_data_logs, drone_data, status)
-
-        # Update drone status display
-        self.root.after(0, self._update_drone_display, drone_data, status)
+        # Queue the data logs row and drone status update for the next batched flush;
+        # the row values are formatted once here and shared by both tables
+        values = self._format_drone_row(reading, status)
+        self._log_queue.append((reading, values))
+        with self.update_lock:
+            self._drone_update_pending[drone_id] = (reading, values)
 
         # Add data to charts
-        if status not in ["Charging", "Returning To Base"]:
-            self.add_data_to_charts(drone_data)
-
-    def _update_data_logs(self, drone_data, status):        
-        # Extract data
-        drone_id = drone_data.get("drone_id", "unknown")
-        timestamp = drone_data.get("timestamp", datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"))
-        temperature = drone_data.get("average_temperature", 0)
-        humidity = drone_data.get("average_humidity", 0)
-        battery = drone_data.get("battery_level", 0)
-        
-        # Format display values
-        display_timestamp = timestamp.replace("T", " ").replace("Z", "")
-        display_temp = f"{temperature:.1f}"
-        display_humidity = f"{humidity:.1f}"
-        display_battery = f"{battery:.1f}"        
-        
-        # Determine row tag based on status and conditions
-        tag = "normal"        
-        if status == "Returning To Base":
-            tag = "returning"
-        elif status == "Charging":
-            tag = "charging"
-        elif battery < 20:
-            tag = "low_battery"
-        elif status == "normal":
-            tag = "normal"
-        
-        # Insert into data logs table (newest at the top)
-        values = (display_timestamp, drone_id, display_temp, display_humidity, 
-                  display_battery, status)
-        self.data_logs_table.insert("", 0, values=values, tags=(tag,))
-        
-        # Limit visible logs (delete old ones if over 1000)
-        children = self.data_logs_table.get_children()
-        if len(children) > 1000:
-            self.data_logs_table.delete(children[-1])
-
-    def _update_drone_display(self, drone_data, status=None):        
-        # Extract data from the drone_data
-        drone_id = drone_data.get("drone_id", "unknown")
-        timestamp = drone_data.get("timestamp", datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"))
-        temperature = drone_data.get("average_temperature", 0)
-        humidity = drone_data.get("average_humidity", 0)
-        battery = drone_data.get("battery_level", 0)
-        
-        # Use provided status or get from data
-        if status is None:
-            status = drone_data.get("status", "Connected")
+        if status not in INACTIVE_STATUSES:
+            self.add_data_to_charts(reading)
+        return status
+
+    def _flush_gui(self):
+        """Apply queued log lines and table updates in one batch and reschedule itself (runs on the Tk thread)"""
+        try:
+            messages = [self._message_queue.popleft() for _ in range(len(self._message_queue))]
+            entries = [self._log_queue.popleft()
+                       for _ in range(min(len(self._log_queue), GUI_FLUSH_BATCH))]
+            new_anomalies = [self._anomaly_queue.popleft()
+                             for _ in range(min(len(self._anomaly_queue), GUI_FLUSH_BATCH))]
+            with self.update_lock:
+                drone_updates, self._drone_update_pending = self._drone_update_pending, {}
+            server_status, self._server_status_pending = self._server_status_pending, None
+            
+            if entries:
+                self._update_data_logs(entries)
+            for reading, values in drone_updates.values():
+                self._update_drone_display(reading, values)
+            if new_anomalies:
+                self._update_anomaly_display(new_anomalies)
+            if messages:
+                self._update_log(messages)
+            if server_status is not None:
+                self._update_status_display(*server_status)
+        finally:
+            self.root.after(GUI_FLUSH_MS, self._flush_gui)
+
+    def _update_data_logs(self, entries):
+        """Add a batch of (reading, values) rows, oldest first, to the data logs (newest at the top)"""
+        self.data_logs_view.prepend([self._data_log_row(reading, values)
+                                     for reading, values in entries])
+
+    def _format_drone_row(self, reading, status):
+        """Format a packet for the tables
+
+        Returns:
+            Tuple (drone_id, timestamp, temperature, humidity, battery, status) of
+            display values in drone table column order
+        """
+        timestamp = reading.timestamp or self._now_strings()[1]
+        temperature = reading.temperature
+        humidity = reading.humidity
+        
+        # Missing averages (None) are shown as N/A rather than failing to format
+        return (reading.drone_id or "unknown",
+                timestamp.replace("T", " ").replace("Z", ""),
+                "N/A" if temperature is None else f"{temperature:.1f}",
+                "N/A" if humidity is None else f"{humidity:.1f}",
+                f"{reading.battery:.1f}",
+                status)
+
+    def _data_log_row(self, reading, values):
+        status = values[5]
+        
+        # Determine row tag based on status and conditions (status color takes precedence)
+        tag = self._STATUS_TAG.get(status) or ("low_battery" if reading.battery < 20 else "normal")
+        
+        # The data logs table lists the timestamp before the drone id
+        return (values[1], values[0]) + values[2:], (tag,)
+
+    def _update_drone_display(self, reading, values=None):        
+        # Format the row from the data unless add_data_entry already did
+        if values is None:
             # Convert snake_case to Title Case if needed
-            if "_" in status:
-                status = " ".join(word.capitalize() for word in status.split("_"))
-        
-        # Format display values
-        display_timestamp = timestamp.replace("T", " ").replace("Z", "")
-        display_temp = f"{temperature:.1f}"
-        display_humidity = f"{humidity:.1f}"
-        display_battery = f"{battery:.1f}"
-        
-        # Check if this drone is already in the table
-        existing_items = self.drone_table.get_children()
-        item_id = None
-        
-        for item in existing_items:
-            if self.drone_table.item(item, "values")[0] == drone_id:
-                item_id = item
-                break
-        
-        # Determine row tag based on status
-        tag = "normal"
-        if battery < 20:
-            tag = "low_battery"
-        elif status == "Charging":
-            tag = "charging"
-        elif status == "Returning To Base":
-            tag = "returning"        
-        elif status == "normal":
-            tag = "normal"
-        
-        # Update or insert into table
-        values = (drone_id, display_timestamp, display_temp, display_humidity, display_battery, status)
-        if item_id:
-            self.drone_table.item(item_id, values=values, tags=(tag,))
+            values = self._format_drone_row(reading, _prettify(reading.status))
+        drone_id, status = values[0], values[5]
+        
+        # Determine row tag based on status (low battery takes precedence)
+        tag = "low_battery" if reading.battery < 20 else self._STATUS_TAG.get(status, "normal")
+        
+        # Update or insert into table; the table is write-only, so the row is compared
+        # with the copy kept here and Tk is only called when something changed.
+        # Each drone's item id is its drone_id, so no lookup is needed to update it
+        row = (values, (tag,))
+        previous = self._drone_rows.get(drone_id)
+        if previous == row:
+            return
+        self._drone_rows[drone_id] = row
+        if previous is not None:
+            self.drone_table.item(str(drone_id), values=values, tags=row[1])
         else:
-            self.drone_table.insert("", tk.END, values=values, tags=(tag,))
+            self.drone_table.insert("", tk.END, iid=str(drone_id), values=values, tags=row[1])
 
     def add_anomalies(self, drone_id, anomalies):
         """
@@ -1032,6 +1520,7 @@ class ServerGUI:
         if not anomalies:
             return
 
+        new_entries = []
         with self.update_lock:            
             if drone_id not in self.last_anomaly_report:
                 self.last_anomaly_report[drone_id] = {}
@@ -1040,85 +1529,62 @@ class ServerGUI:
                 sensor_id = anomaly.get("sensor_id")
                 issue = anomaly.get("issue")
                 value = anomaly.get("value")
-                
-
-
-        
                 anomaly_key = (sensor_id, issue)
 
-        
-        if anomaly_key not in self.last_anomaly_report[drone_id] or \
-            self.last_anomaly_report[drone_id][anomaly_key] != value:
-
- 
-            anomaly_entry = anomaly.copy()
-            anomaly_entry["drone_id"] = drone_id
- 
-
-            self.anomalies.append(anomaly_entry)
+                # Skip anomalies already reported with the same value
+                if anomaly_key in self.last_anomaly_report[drone_id] and \
+                    self.last_anomaly_report[drone_id][anomaly_key] == value:
+                    continue
 
- 
-            self.last_anomaly_report[drone_id][anomaly_key] = value
+                anomaly_entry = anomaly.copy()
+                anomaly_entry["drone_id"] = drone_id
+                self.anomalies.append(anomaly_entry)
+                self.last_anomaly_report[drone_id][anomaly_key] = value
+                new_entries.append(anomaly_entry)
 
-            if len(self.anomalies) > 1000:
-                self.anomalies.pop(0)
+                log_issue = anomaly.get("issue", "unknown")
+                log_sensor_id = anomaly.get("sensor_id", "unknown")
+                log_value = anomaly.get("value", "N/A")
+                self.log("Anomaly detected on %s, sensor %s: %s (%s)", "warning",
+                         (drone_id, log_sensor_id, log_issue, log_value))
 
-
-            
-            self.root.after(0, self._update_anomaly_display, [anomaly_entry])
-            
-            log_issue = anomaly.get("issue", "unknown")
-            log_sensor_id = anomaly.get("sensor_id", "unknown")
-            log_value = anomaly.get("value", "N/A")
-            self.log(f"Anomaly detected on {drone_id}, sensor {log_sensor_id}: {log_issue} ({log_value})", "warning")
+        # Hand all new anomalies to the next GUI flush at once
+        if new_entries:
+            self._anomaly_queue.extend(new_entries)
 
     def _update_anomaly_display(self, new_anomalies):
         # Process each new anomaly
+        rows = []
         for anomaly in new_anomalies:
             # Extract data
             drone_id = anomaly.get("drone_id", "unknown")
             sensor_id = anomaly.get("sensor_id", "unknown")
             issue = anomaly.get("issue", "unknown")
             value = anomaly.get("value", 0)
-            timestamp = anomaly.get("timestamp", datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"))
+            timestamp = anomaly.get("timestamp") or self._now_strings()[1]
 
             # Format display values
             display_timestamp = timestamp.replace("T", " ").replace("Z", "")
             display_value = f"{value:.1f}" if isinstance(value, (float, int)) else str(value)
 
             # Format issue text (convert snake_case to readable text)
-            if "_" in issue:
-                display_issue = " ".join(word.capitalize() for word in issue.split("_"))
-            else:
-                display_issue = issue.capitalize()
+            display_issue = _prettify(issue) if "_" in issue else issue.capitalize()
 
             # Determine row tag based on issue type
-            tag = "temperature" if "temp" in issue.lower() else \
-                "humidity" if "humid" in issue.lower() else \
-                "battery" if "battery" in issue.lower() else \
-                "connection"
+            tag = _classify_anomaly(issue)
 
-            # Insert into anomaly table (newest at the top)
             values = (drone_id, sensor_id, display_issue, display_value, display_timestamp)
-            self.anomaly_table.insert("", 0, values=values, tags=(tag,))
+            rows.append((values, (tag,)))
 
-            # Limit visible anomalies (delete old ones if over 100)
-            children = self.anomaly_table.get_children()
-            if len(children) > 100:
-                self.anomaly_table.delete(children[-1])
+        # Add to the anomaly table (newest at the top, last 100 kept)
+        self.anomaly_view.prepend(rows)
 
     def update_drone_status(self, drone_id, status, battery, temperature, humidity):        
         # Get current timestamp
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp = self._now_strings()[1]
         
         # Create or update status entry without triggering additional logs
-        self.drone_statuses[drone_id] = {
-            "status": status,
-            "timestamp": timestamp,
-            "battery": battery,
-            "temperature": temperature,
-            "humidity": humidity
-        }
+        self.drone_statuses[drone_id] = DroneStatus(status, timestamp, battery, temperature, humidity)
 
     def on_closing(self):
         """
@@ -1159,9 +1625,18 @@ class CentralServer:
 
         # Thread control
         self.server_running = False
-        # Store active connections with associated info (socket, last_active time, drone_id)
+        # Store active connections with associated info (socket, last_active time, drone_id).
+        # The dict is never mutated in place: writers build a new dict under connection_lock
+        # and swap it in, so readers can iterate the current one without taking the lock
         self.active_connections = {}
-        self.connection_lock = threading.Lock() # Lock for accessing active_connections
+        self.connection_lock = threading.Lock() # Serializes writers of active_connections
+        # drone_id -> addrs of its identified connections (server thread only)
+        self.drone_to_addrs = {}
+        # Heap of (deadline, seq, addr, client_info) connection timeout timers (server thread only)
+        self._deadlines = []
+        self._deadline_seq = itertools.count()
+        # Receive buffer reused for every recv_into; only the selector thread reads into it
+        self._recv_view = memoryview(bytearray(RECV_BUFFER_SIZE))
 
         # Start the server
         self.gui.log("Central server initializing...")
@@ -1179,11 +1654,6 @@ class CentralServer:
         self.server_thread.daemon = True # Allow main thread to exit even if this is running
         self.server_thread.start()
 
-        # Start connection monitor thread
-        self.monitor_thread = threading.Thread(target=self._monitor_connections)
-        self.monitor_thread.daemon = True # Allow main thread to exit
-        self.monitor_thread.start()
-
         self.gui.log(f"Central server started and listening on {self.listen_ip}:{self.listen_port}")
         self.gui.update_server_status("Running", len(self.active_connections))
 
@@ -1196,21 +1666,17 @@ class CentralServer:
         self.gui.log("Server shutting down...")
         self.server_running = False
 
-        # Close all active connections
+        # Take all active connections out of the table, then close them outside the lock
         with self.connection_lock:
-            # Iterate over a copy of keys because the dict will be modified
-            for addr in list(self.active_connections.keys()):
-                client_info = self.active_connections.get(addr)
-                if client_info and client_info.get("connection"):
-                    try:
-                        client_info["connection"].shutdown(socket.SHUT_RDWR) # Attempt graceful shutdown
-                        client_info["connection"].close()
-                        self.gui.log(f"Closed connection to {addr}")
-                    except Exception as e:
-                        self.gui.log(f"Error closing connection to {addr}: {e}", level='error')
-                # Remove from active connections
-                if addr in self.active_connections:
-                    del self.active_connections[addr]
+            connections, self.active_connections = self.active_connections, {}
+        for addr, client_info in connections.items():
+            if client_info.get("connection"):
+                try:
+                    client_info["connection"].shutdown(socket.SHUT_RDWR) # Attempt graceful shutdown
+                    client_info["connection"].close()
+                    self.gui.log(f"Closed connection to {addr}")
+                except Exception as e:
+                    self.gui.log(f"Error closing connection to {addr}: {e}", level='error')
 
         # Close server socket if it exists
         if hasattr(self, 'server_socket') and self.server_socket:
@@ -1228,58 +1694,46 @@ class CentralServer:
 
 
     def _start_server(self):
-        """Start the TCP server to listen for drone connections"""
+        """Start the TCP server and serve all drone connections from this thread
+
+        A selector waits on the listening socket and every client socket at once, so
+        there is no thread per drone; each readable socket is serviced in turn. The
+        same loop closes connections that have timed out.
+        """
+        sel = selectors.DefaultSelector()
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             # Allow the socket to reuse an address quickly after closing
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.listen_ip, self.listen_port))
             self.server_socket.listen(5) # Max 5 pending connections
+            self.server_socket.setblocking(False)
             self.gui.log(f"Server socket bound to {self.listen_ip}:{self.listen_port}")
 
+            # The listening socket is registered without data; client sockets carry their addr
+            sel.register(self.server_socket, selectors.EVENT_READ)
+
+            self.gui.log(f"Connection timeout is {CONNECTION_TIMEOUT}s.")
+
             while self.server_running:
-                # Set a timeout so the accept call doesn't block indefinitely,
-                # allowing the loop to check `self.server_running`
-                self.server_socket.settimeout(1.0)
+                # Wake up at least once a second to check `self.server_running`
+                for key, _ in sel.select(timeout=1.0):
+                    if key.data is None:
+                        self._accept_client(sel)
+                    else:
+                        self._read_client(sel, key.fileobj, key.data)
 
-                try:
-                    client_socket, addr = self.server_socket.accept()
-
-                    # Accept the connection and start a new thread to handle it
-                    self.gui.log(f"New connection attempt from {addr}")
-
-                    # Add to active connections with timestamp
-                    with self.connection_lock:
-                        self.active_connections[addr] = {
-                            "connection": client_socket,
-                            "last_active": time.time(),
-                            "drone_id": None  # Will be set when first data is received
-                        }
-
-                    # Update connection count in GUI
-                    self.gui.update_server_status("Running", len(self.active_connections))
-                    self.gui.log(f"Connection accepted from {addr}")
-
-                    # Start client handler thread
-                    client_thread = threading.Thread(target=self._handle_client,
-                                                   args=(client_socket, addr))
-                    client_thread.daemon = True # Thread exits when main program exits
-                    client_thread.start()
-
-                except socket.timeout:
-                    # This is expected, just continue the loop to check server_running
-                    continue
-                except Exception as e:
-                    if self.server_running: # Only log errors if the server is supposed to be running
-                        self.gui.log(f"Error accepting connection: {e}", level='error')
-                        # Small delay before trying to accept again after an error
-                        time.sleep(0.1)
+                # Only the earliest timer needs checking
+                if self._deadlines and self._deadlines[0][0] <= time.time():
+                    self._expire_connections(sel)
 
         except Exception as e:
-            self.gui.log(f"Fatal server error: {e}", level='error')
-            self.gui.update_server_status("Error", len(self.active_connections))
+            if self.server_running: # Only report errors if the server is supposed to be running
+                self.gui.log(f"Fatal server error: {e}", level='error')
+                self.gui.update_server_status("Error", len(self.active_connections))
             self.server_running = False # Stop the server loop on fatal error
         finally:
+            sel.close()
             # Ensure server socket is closed if the loop exits
             if hasattr(self, 'server_socket') and self.server_socket:
                  try:
@@ -1289,211 +1743,246 @@ class CentralServer:
                      self.gui.log(f"Error closing server socket in finally block: {e}", level='error')
 
 
-    def _handle_client(self, client_socket, addr):
-        """Handle communication with a connected drone"""
-        buffer = ""
-        drone_id = None # Store drone_id once identified
-
+    def _accept_client(self, sel):
+        """Accept a pending drone connection and register it with the selector"""
         try:
-            self.gui.log(f"Handler started for client {addr}")
-            client_socket.settimeout(60)  # Timeout for receiving data
+            client_socket, addr = self.server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return # Another wakeup already took the connection
+        except Exception as e:
+            self.gui.log(f"Error accepting connection: {e}", level='error')
+            return
 
-            while self.server_running:
-                try:
-                    # Receive data in chunks
-                    data = client_socket.recv(4096).decode('utf-8')
-                    if not data:
-                        # Client disconnected gracefully
-                        self.gui.log(f"Client {addr} disconnected gracefully")
-                        break # Exit the handler loop
-
-                    # Update last active timestamp for this connection
-                    with self.connection_lock:
-                        if addr in self.active_connections:
-                            self.active_connections[addr]["last_active"] = time.time()
-
-                    buffer += data
-
-                    # Process complete JSON objects separated by newline
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        if not line.strip(): # Skip empty lines
-                            continue
-
-                        try:
-                            drone_data = json.loads(line)
-
-                            # Identify drone ID if not already known
-                            if drone_id is None and "drone_id" in drone_data:
-                                drone_id = drone_data["drone_id"]
-                                with self.connection_lock:
-                                     if addr in self.active_connections:
-                                          self.active_connections[addr]["drone_id"] = drone_id
-                                self.gui.log(f"Identified drone {drone_id} at {addr}")
-
-                            # Process the received data (temperature, humidity, battery, anomalies)
-                            self._process_drone_data(drone_data)
-
-                        except json.JSONDecodeError:
-                            self.gui.log(f"Error: Invalid JSON from {addr}. Data: '{line[:100]}...'", level='error')
-                            # Optionally, skip the rest of the buffer if JSON is consistently bad
-                            # buffer = "" # Uncomment to clear buffer on JSON error
-                            continue # Continue processing the rest of the buffer
-
-
-                except socket.timeout:
-                    # No data received within the timeout period.
-                    # The monitor thread will handle marking as disconnected if it persists.
-                    # Just continue the loop to check server_running and try recv again.
-                    continue
-                except ConnectionResetError:
-                    self.gui.log(f"Connection reset by peer: {addr}", level='warning')
-                    break # Exit the handler loop on connection reset
-                except Exception as e:
-                    # Catch other potential errors during recv or processing
-                    self.gui.log(f"Error handling data from {addr}: {e}", level='error')
-                    break # Exit the handler loop on other errors
+        self.gui.log(f"New connection attempt from {addr}")
+        client_socket.setblocking(False)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"): # Linux; other platforms keep the system defaults
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+
+        # Add to active connections with timestamp and a receive buffer
+        client_info = {
+            "connection": client_socket,
+            "last_active": time.time(),
+            "drone_id": None,  # Will be set when first data is received
+            "buffer": bytearray()
+        }
+        with self.connection_lock:
+            self.active_connections = {**self.active_connections, addr: client_info}
+        heapq.heappush(self._deadlines, (client_info["last_active"] + CONNECTION_TIMEOUT,
+                                         next(self._deadline_seq), addr, client_info))
+        sel.register(client_socket, selectors.EVENT_READ, data=addr)
 
-        except Exception as e:
-            # Catch exceptions that might occur outside the inner loop (less common)
-            self.gui.log(f"Unexpected error in client handler for {addr}: {e}", level='error')
+        # Update connection count in GUI
+        self.gui.update_server_status("Running", len(self.active_connections))
+        self.gui.log(f"Connection accepted from {addr}")
 
-        finally:
-            # This block executes when the client handler thread is exiting
-            self.gui.log(f"Handler exiting for client {addr}")
-
-            # Clean up the connection in the active_connections dictionary
-            with self.connection_lock:
-                if addr in self.active_connections:
-                     # Remove the connection entry
-                     del self.active_connections[addr]
-                     self.gui.log(f"Removed connection {addr} from active list.")
-
-            # Update connection count in GUI
-            active_count = len(self.active_connections)
-            self.gui.update_server_status("Running", active_count)
-
-            # Mark the drone as disconnected in the GUI if its ID was known
-            if drone_id:
-                 # Check if this drone ID is still associated with any active connection
-                 # This handles cases where a drone might reconnect quickly
-                 is_drone_still_connected = any(info.get("drone_id") == drone_id and info.get("connection") is not None
-                                                 for info in self.active_connections.values())
-                 if not is_drone_still_connected:
-                      # If no other active connection has this drone_id, mark it as disconnected in GUI
-                      # The monitor thread will eventually mark it if this handler didn't run due to an error
-                      # But doing it here ensures a faster GUI update on clean disconnects
-                      current_status = self.gui.drone_statuses.get(drone_id, {}).get("status")
-                      if current_status != "Disconnected":
-                           self.gui.log(f"Drone {drone_id} appears disconnected.", level='warning')
-                           # The monitor thread will add the anomaly, just update status here
-                           self.gui.update_drone_status(drone_id, "Disconnected",
-                                                        self.gui.drone_statuses.get(drone_id, {}).get("battery", 0),
-                                                        self.gui.drone_statuses.get(drone_id, {}).get("temp", 0),
-                                                        self.gui.drone_statuses.get(drone_id, {}).get("humidity", 0))
-
-            # Ensure the socket is closed
+
+    def _read_client(self, sel, client_socket, addr):
+        """Drain a readable drone socket and process every complete message"""
+        client_info = self.active_connections.get(addr)
+        if client_info is None:
+            # Dropped by stop(); the socket is being closed
+            return
+
+        buffer = client_info["buffer"]
+        view = self._recv_view
+        received = False
+        closed = False
+        # Keep reading while reads fill the whole buffer; a short read means the
+        # socket is drained, so no extra recv is spent just to hit EAGAIN
+        for _ in range(RECV_MAX_READS):
+            try:
+                n = client_socket.recv_into(view)
+            except (BlockingIOError, InterruptedError):
+                break
+            except ConnectionResetError:
+                self.gui.log(f"Connection reset by peer: {addr}", level='warning')
+                closed = True
+                break
+            except OSError as e:
+                self.gui.log(f"Error handling data from {addr}: {e}", level='error')
+                closed = True
+                break
+
+            if not n:
+                # Client disconnected gracefully
+                self.gui.log(f"Client {addr} disconnected gracefully")
+                closed = True
+                break
+
+            buffer += view[:n]
+            received = True
+            if n < len(view):
+                break
+
+        if received:
+            # Update last active timestamp for this connection
+            client_info["last_active"] = time.time()
             try:
-                client_socket.close()
-                self.gui.log(f"Socket closed for {addr}")
+                self._process_lines(addr, client_info, buffer)
             except Exception as e:
-                self.gui.log(f"Error closing socket for {addr}: {e}", level='error')
+                # Catch other potential errors during processing
+                self.gui.log(f"Error handling data from {addr}: {e}", level='error')
+                closed = True
+
+        if closed:
+            self._close_client(sel, client_socket, addr)
+
 
+    def _process_lines(self, addr, client_info, buffer):
+        """Parse and process the complete newline-delimited JSON messages in a connection's buffer"""
+        # Lines are sliced out by offset and the consumed prefix is dropped once
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end < 0:
+                break
+            line = buffer[start:end]
+            start = end + 1
+            if not line.strip(): # Skip empty lines
+                continue
 
-    def _process_drone_data(self, drone_data):
+            try:
+                reading = _decode_reading(line)
+            except ValueError:
+                # JSONDecodeError (from any parser), schema errors and invalid UTF-8 are all ValueErrors
+                self.gui.log(f"Error: Invalid JSON from {addr}. Data: '{line[:100].decode('utf-8', 'replace')}...'", level='error')
+                # Optionally, skip the rest of the buffer if JSON is consistently bad
+                # buffer.clear() # Uncomment to clear buffer on JSON error
+                continue # Continue processing the rest of the buffer
+
+            # Identify drone ID if not already known
+            if client_info["drone_id"] is None and reading.drone_id:
+                client_info["drone_id"] = reading.drone_id
+                self.drone_to_addrs.setdefault(client_info["drone_id"], set()).add(addr)
+                self.gui.log(f"Identified drone {client_info['drone_id']} at {addr}")
+
+            # Process the received data (temperature, humidity, battery, anomalies)
+            self._process_drone_data(reading)
+        del buffer[:start]
+
+
+    def _close_client(self, sel, client_socket, addr):
+        """Unregister and close a drone connection and mark the drone disconnected if it has no other
+
+        Returns:
+            The drone_id if this call marked that drone disconnected, otherwise None
+        """
+        self.gui.log(f"Closing connection for client {addr}")
+        try:
+            sel.unregister(client_socket)
+        except (KeyError, ValueError):
+            pass
+
+        # Clean up the connection in the active_connections dictionary
+        drone_id = None
+        with self.connection_lock:
+            connections = dict(self.active_connections)
+            client_info = connections.pop(addr, None)
+            self.active_connections = connections
+            if client_info is not None:
+                drone_id = client_info["drone_id"]
+                self.gui.log(f"Removed connection {addr} from active list.")
+
+        # Update connection count in GUI
+        active_count = len(connections)
+        self.gui.update_server_status("Running", active_count)
+
+        # Mark the drone as disconnected in the GUI if its ID was known
+        marked = None
+        if drone_id:
+             # Check if this drone ID is still associated with any active connection
+             # This handles cases where a drone might reconnect quickly
+             addrs = self.drone_to_addrs.get(drone_id)
+             if addrs is not None:
+                 addrs.discard(addr)
+                 if not addrs:
+                     del self.drone_to_addrs[drone_id]
+             is_drone_still_connected = bool(addrs)
+             if not is_drone_still_connected:
+                  # If no other active connection has this drone_id, mark it as disconnected in GUI
+                  current = self.gui.drone_statuses.get(drone_id, NO_STATUS)
+                  if current.status != "Disconnected":
+                       self.gui.log(f"Drone {drone_id} appears disconnected.", level='warning')
+                       # Timeouts also add an anomaly, see _expire_connections
+                       marked = drone_id
+                       self.gui.update_drone_status(drone_id, "Disconnected",
+                                                    current.battery, current.temperature, current.humidity)
+
+        # Ensure the socket is closed
+        try:
+            client_socket.close()
+            self.gui.log(f"Socket closed for {addr}")
+        except Exception as e:
+            self.gui.log(f"Error closing socket for {addr}: {e}", level='error')
+        return marked
+
+
+    def _process_drone_data(self, reading):
         """Process data received from a drone and update the GUI"""
-        drone_id = drone_data.get("drone_id")
+        drone_id = reading.drone_id
         if not drone_id:
             # Use self.gui.log as this is the server class logging
             self.gui.log("Received data without drone_id. Cannot process.", level='warning')
             return
         
-        self.gui.log(f"Processing data from drone {drone_id}")
+        self.gui.log("Processing data from drone %s", args=(drone_id,))
 
-        self.gui.add_data_entry(drone_data)
+        # add_data_entry returns the status it just stored, so no lookup is needed
+        current_status = self.gui.add_data_entry(reading)
+
+        # Anomalies are ignored in 'Returning To Base' or 'Charging' states, so check
+        # the status before looking at them
+        if current_status in INACTIVE_STATUSES:
+            #self.gui.log(f"Skipping detailed anomaly processing for {drone_id} due to status: {current_status}", "info")
+            return
 
         # Process anomalies if present
-        anomalies = drone_data.get("anomalies")
+        anomalies = reading.anomalies
         if anomalies and isinstance(anomalies, list):
-            current_status = self.gui.drone_statuses.get(drone_id, {}).get("status")
-
-            # 'Returning To Base' or 'Charging' states.
-            if current_status not in ["Returning To Base", "Charging"]:
-                # Call the add_anomalies method in ServerGUI to handle logging and UI updates                 
-                self.gui.add_anomalies(drone_id, anomalies)            
-                #self.gui.log(f"Skipping detailed anomaly processing for {drone_id} due to status: {current_status}", "info")    
-
-
-    def _monitor_connections(self):
-        """Periodically check active connections and remove inactive ones"""
-        timeout_seconds = 45 # Mark as disconnected if no data for 45 seconds
-        cleanup_interval = 15 # Check every 15 seconds
-
-        self.gui.log(f"Connection monitor started with timeout {timeout_seconds}s and interval {cleanup_interval}s.")
-
-        while self.server_running:
-            time.sleep(cleanup_interval)
-
-            if not self.server_running:
-                break # Exit loop if server is stopping
-
-            now = time.time()
-            disconnected_addrs = []
-
-            with self.connection_lock:
-                # Find connections that have timed out
-                for addr, client_info in self.active_connections.items():
-                    if (now - client_info["last_active"]) > timeout_seconds:
-                        disconnected_addrs.append(addr)
-
-                # Process timed-out connections
-                for addr in disconnected_addrs:
-                    client_info = self.active_connections.get(addr)
-                    if client_info:
-                         drone_id = client_info.get("drone_id", addr) # Use addr if drone_id not known
-                         self.gui.log(f"Connection to {drone_id} at {addr} timed out.", level='warning')
-
-                         # Close the socket if it's still open
-                         conn = client_info.get("connection")
-                         if conn:
-                             try:
-                                 conn.shutdown(socket.SHUT_RDWR) # Attempt graceful shutdown
-                                 conn.close()
-                                 self.gui.log(f"Closed timed-out socket for {addr}")
-                             except Exception as e:
-                                 self.gui.log(f"Error closing timed-out socket for {addr}: {e}", level='error')
-
-                         # Remove from active connections
-                         if addr in self.active_connections:
-                              del self.active_connections[addr]
-
-                         # Update GUI status for the drone
-                         # Check if this drone ID is still associated with any *other* active connection
-                         is_drone_still_connected = any(info.get("drone_id") == drone_id and info.get("connection") is not None
-                                                         for info in self.active_connections.values())
-
-                         if not is_drone_still_connected:
-                              # If no other active connection has this drone_id, mark it as disconnected in GUI
-                              current_status = self.gui.drone_statuses.get(drone_id, {}).get("status")
-                              if current_status != "Disconnected":
-                                   self.gui.log(f"Marking drone {drone_id} as disconnected in GUI.")
-                                   self.gui.update_drone_status(drone_id, "Disconnected",
-                                                                 self.gui.drone_statuses.get(drone_id, {}).get("battery", 0),
-                                                                 self.gui.drone_statuses.get(drone_id, {}).get("temp", 0),
-                                                                 self.gui.drone_statuses.get(drone_id, {}).get("humidity", 0))
-                                   # Add a 'connection_lost' anomaly
-                                   self.gui.add_anomalies(drone_id, [{
-                                       "issue": "connection_lost",
-                                       "value": timeout_seconds, # Value could be the timeout duration
-                                       "threshold": timeout_seconds,
-                                       "timestamp": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                                       "sensor_id": "N/A"
-                                   }])
-
-
-            # Update connection count in GUI
-            active_count = len(self.active_connections)
-            self.gui.update_server_status("Running", active_count)
+            # Call the add_anomalies method in ServerGUI to handle logging and UI updates
+            self.gui.add_anomalies(drone_id, anomalies)
+
+
+    def _expire_connections(self, sel):
+        """Close connections with no data for CONNECTION_TIMEOUT seconds (server thread only)
+
+        Receiving data only updates last_active; a timer that comes due for a connection
+        that has been active since is pushed back to its new deadline instead.
+        """
+        now = time.time()
+        expired = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, seq, addr, client_info = heapq.heappop(self._deadlines)
+            if self.active_connections.get(addr) is not client_info:
+                continue # Already closed
+            deadline = client_info["last_active"] + CONNECTION_TIMEOUT
+            if deadline > now:
+                heapq.heappush(self._deadlines, (deadline, seq, addr, client_info))
+            else:
+                expired.append((addr, client_info))
+
+        if not expired:
+            return
+
+        # All drones timing out in this sweep share one 'connection_lost' anomaly;
+        # add_anomalies copies the entries it keeps, so the payload is never modified
+        connection_lost = ({
+            "issue": "connection_lost",
+            "value": CONNECTION_TIMEOUT, # Value could be the timeout duration
+            "threshold": CONNECTION_TIMEOUT,
+            "timestamp": self.gui._now_strings()[1],
+            "sensor_id": "N/A"
+        },)
+        for addr, client_info in expired:
+            drone_id = client_info["drone_id"] or addr # Use addr if drone_id not known
+            self.gui.log(f"Connection to {drone_id} at {addr} timed out.", level='warning')
+
+            # Add a 'connection_lost' anomaly when the close marked the drone disconnected
+            if self._close_client(sel, client_info["connection"], addr):
+                self.gui.add_anomalies(drone_id, connection_lost)
 
 
 # --- Main Execution Block ---
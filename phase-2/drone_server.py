@@ -6,6 +6,7 @@ import time
 import tkinter as tk
 from tkinter import ttk
 import datetime
+from collections import deque
 
 from queue import Queue, Full
 
@@ -21,6 +22,16 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Check if orjson is available for faster uplink encoding
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    USING_ORJSON = False
+
+# Both parsers accept UTF-8 bytes directly, so sensor data is never decoded to str
+_json_loads = orjson.loads if USING_ORJSON else json.loads
+
 
 class EdgeProcessor:
     """Processes data received from sensor nodes"""
@@ -340,7 +351,12 @@ class DroneClient:
             }
             
             try:
-                self.sock.sendall((json.dumps(data) + "\n").encode())
+                if USING_ORJSON:
+                    # orjson returns bytes directly and appends the newline frame itself
+                    payload = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+                else:
+                    payload = (json.dumps(data) + "\n").encode()
+                self.sock.sendall(payload)
                 return True
             except (ConnectionResetError, BrokenPipeError):
                 self.connected = False
@@ -1671,6 +1687,8 @@ class DroneServer:
         self.data_queue = Queue(maxsize=100)  # Buffer for incoming sensor data
         self.active_connections = {}  # Track active sensor connections
         self.connection_lock = threading.Lock()
+        # Receive buffers released by closed connections, reused by new ones
+        self._recv_buffers = deque(maxlen=16)
 
         self.connection_manager = ConnectionManager(
         self.active_connections, 
@@ -1820,6 +1838,8 @@ class DroneServer:
     def _handle_client(self, client_socket, addr):
         """Handle communication with a connected sensor node"""
         sensor_id = None
+        sensor_ids = set()  # Sensors seen on this connection; several share it with --shared-connection
+        view = None
         try:
             # Add to active connections
             with self.connection_lock:
@@ -1829,7 +1849,12 @@ class DroneServer:
             client_socket.settimeout(60)  # 60 second timeout
             
             # Receive data from the client
-            buffer = ""
+            buffer = bytearray()
+            # Take a receive buffer from the pool (deque pop/append are thread-safe)
+            try:
+                view = self._recv_buffers.pop()
+            except IndexError:
+                view = memoryview(bytearray(4096))
             while self.server_running:
                 # Check if we should disconnect due to battery
                 battery_status = self.battery_manager.check_status()
@@ -1837,42 +1862,56 @@ class DroneServer:
                     self.log(f"Disconnecting {addr} - drone returning to base")
                     break
                 
-                data = client_socket.recv(4096).decode('utf-8')
-                if not data:
+                # Read straight into the reusable buffer instead of allocating per recv
+                n = client_socket.recv_into(view)
+                if not n:
                     self.log(f"Client {addr} disconnected")
                     break
                 
-                buffer += data
+                buffer += view[:n]
                 
-                # Process complete JSON objects
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
+                # Process complete JSON objects; lines are sliced out by offset and
+                # the consumed prefix is dropped once per chunk
+                start = 0
+                while True:
+                    end = buffer.find(b'\n', start)
+                    if end < 0:
+                        break
+                    line = buffer[start:end]
+                    start = end + 1
                     try:
-                        sensor_data = json.loads(line)
-                        current_sensor_id = sensor_data.get('sensor_id')
-
-                        if current_sensor_id and (not sensor_id or sensor_id != current_sensor_id):
-                            sensor_id = current_sensor_id
+                        sensor_data = _json_loads(line)
+                    except ValueError:
+                        # JSONDecodeError (from either parser) and invalid UTF-8 are both ValueErrors
+                        self.log(f"Error: Invalid JSON from {addr}")
+                        continue
+                    
+                    current_sensor_id = sensor_data.get('sensor_id')
+
+                    if current_sensor_id:
+                        sensor_id = current_sensor_id
+                        # Register each sensor once, not every time lines from
+                        # different sensors alternate on a shared connection
+                        if sensor_id not in sensor_ids:
+                            sensor_ids.add(sensor_id)
                             self.connection_manager.register_node(sensor_id, addr)
 
 
-                        if not self.data_stream_active:
-                        # Optional: Uncomment if you want verbose logging of skipped data
-                            self.log(f"Data stream paused. Ignoring data from sensor {sensor_id or 'Unknown'}")
-                            continue  # S
+                    if not self.data_stream_active:
+                    # Optional: Uncomment if you want verbose logging of skipped data
+                        self.log(f"Data stream paused. Ignoring data from sensor {sensor_id or 'Unknown'}")
+                        continue  # S
+                
+                    self.log(f"Received data from sensor {sensor_id}")
+
                     
-                        self.log(f"Received data from sensor {sensor_id}")
-
-                        
-                        
-                        # Add to processing queue
-                        try:
-                            self.data_queue.put(sensor_data, block=False)
-                        except Full:
-                            self.log("Warning: Data queue full, dropping sensor data")
-                    except json.JSONDecodeError:
-                        self.log(f"Error: Invalid JSON from {addr}")
-                        continue
+                    
+                    # Add to processing queue
+                    try:
+                        self.data_queue.put(sensor_data, block=False)
+                    except Full:
+                        self.log("Warning: Data queue full, dropping sensor data")
+                del buffer[:start]
         
         except socket.timeout:
             self.log(f"Connection to {addr} timed out")
@@ -1881,8 +1920,10 @@ class DroneServer:
         except Exception as e:
             self.log(f"Error handling client {addr}: {e}")
         finally:
-            # Clean up the connection
+            # Clean up the connection and return its receive buffer to the pool
             client_socket.close()
+            if view is not None:
+                self._recv_buffers.append(view)
             with self.connection_lock:
                 if addr in self.active_connections:
                     del self.active_connections[addr]
@@ -2037,6 +2078,9 @@ class ConnectionManager:
     def disconnect_node(self, sensor_id):
         """Disconnect a specific node by sensor ID
         
+        A node whose connection is shared with other sensors (--shared-connection) is
+        not disconnected, since closing the socket would drop every sensor on it.
+        
         Returns:
             bool: True if successfully disconnected, False otherwise
         """
@@ -2047,6 +2091,14 @@ class ConnectionManager:
                 self.logger(f"Cannot disconnect node {sensor_id}: address not found")
                 return False
             
+            # Refuse to close a connection that other sensors also send over
+            others = [node for node, node_addr in self.node_to_addr.items()
+                      if node_addr == addr and node != sensor_id]
+            if others:
+                self.logger(f"Cannot disconnect node {sensor_id}: its connection is shared with "
+                            f"{', '.join(others)}")
+                return False
+            
             # Check if the connection is still active
             if addr not in self.active_connections:
                 self.logger(f"Cannot disconnect node {sensor_id}: connection not active")
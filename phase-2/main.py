@@ -82,10 +82,11 @@ def start_drone_server(drone_ip, drone_port, server_ip, server_port):
            "--server-ip", server_ip, "--server-port", str(server_port)]
     return launch_process(cmd, "Drone server")
 
-def start_sensor_node(sensor_id, drone_ip, drone_port, min_interval, max_interval):
-    cmd = [sys.executable, "nodes.py", "--id", f"sensor_{sensor_id:02d}", "--ip", drone_ip,
+def start_sensor_nodes(sensor_ids, drone_ip, drone_port, min_interval, max_interval):
+    # All sensors in one interval band share a single process, one thread each
+    cmd = [sys.executable, "nodes.py", "--id", *[f"sensor_{i:02d}" for i in sensor_ids], "--ip", drone_ip,
            "--port", str(drone_port), "--min-interval", str(min_interval), "--max-interval", str(max_interval)]
-    return launch_process(cmd, f"Sensor node {sensor_id:02d}")
+    return launch_process(cmd, f"Sensor nodes {', '.join(f'{i:02d}' for i in sensor_ids)}")
 
 
 def threaded_launcher(target, args=()):
@@ -122,15 +123,18 @@ def main():
             time.sleep(2)
 
     if args.mode in ['all', 'sensors']:
-        for i in range(1, args.num_sensors + 1):
-            if i <= 2:
-                min_iv, max_iv = 2, 3  # hızlı sensörler
-            else:
-                min_iv, max_iv = 5, 8  # yavaş sensörler
-
+        sensor_ids = range(1, args.num_sensors + 1)
+        bands = [
+            ([i for i in sensor_ids if i <= 2], 2, 3),  # hızlı sensörler
+            ([i for i in sensor_ids if i > 2], 5, 8),  # yavaş sensörler
+        ]
+
+        for ids, min_iv, max_iv in bands:
+            if not ids:
+                continue
             threads.append(threaded_launcher(
-                start_sensor_node,
-                (i, args.drone_ip, args.drone_port, min_iv, max_iv)
+                start_sensor_nodes,
+                (ids, args.drone_ip, args.drone_port, min_iv, max_iv)
             ))
             time.sleep(1)
 
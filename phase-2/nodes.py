@@ -1,10 +1,368 @@
 import json
 import socket
+import struct
 import time
 import random
-import datetime
 import logging
-from threading import Thread, Timer
+import heapq
+import itertools
+from threading import Thread, Event, Lock, Condition, stack_size
+
+# Check if numpy is available for vectorized random draws
+try:
+    import numpy as np
+    USING_NUMPY = True
+except ImportError:
+    USING_NUMPY = False
+
+# Shared generator for SensorNode.collect_batch; seeding one per call costs more than the draws
+_batch_rng = np.random.default_rng() if USING_NUMPY else None
+
+# Seconds to wait for the TCP handshake with the drone before giving up
+CONNECT_TIMEOUT = 2.0
+
+# A pending batch of readings is flushed once it reaches either limit
+SEND_BATCH_SIZE = 16
+SEND_BATCH_BYTES = 32768
+
+# sendmsg is unavailable on Windows; fall back to joining the batch there
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# A shared drone connection writes once this many bytes are pending (about one
+# Ethernet MTU) or once the oldest pending reading has waited this many seconds
+SHARED_FLUSH_BYTES = 1400
+SHARED_FLUSH_INTERVAL = 0.02
+
+# Kernel send buffer for drone sockets; holds a full batch (SEND_BATCH_BYTES) with room to spare
+SEND_BUFFER_SIZE = 64 * 1024
+
+# Milliseconds unacknowledged data may linger before the kernel drops the connection (Linux)
+TCP_USER_TIMEOUT_MS = 10000
+
+# Decorrelated jitter backoff bounds for reconnection attempts, in seconds
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+# Backoff cap after a refused connect: the drone host is up but not listening yet
+# (typically restarting), so retry much sooner than after a timeout
+REFUSED_BACKOFF_CAP = 5.0
+
+# Probability that a single reading is anomalously high
+TEMP_ANOMALY_RATE = 0.05
+HUMIDITY_ANOMALY_RATE = 0.01
+
+# Stack size for sensor threads; the run loop is shallow, so the platform default
+# (often 8 MiB of reserved address space per thread) is far more than needed
+SENSOR_THREAD_STACK_SIZE = 256 * 1024
+
+# Number of uniform [0, 1) samples generated per refill of the random pool
+RNG_POOL_SIZE = 4096
+
+_CONFIGURED = False
+
+
+def _configure_logging(level=logging.INFO):
+    """
+    Configure the root logger once per process; loggers are named after the sensor_id.
+
+    Args:
+        level (int): Root log level, applied only by the first call
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    logging.basicConfig(
+        level=level,
+        format='[%(name)s] %(asctime)s - %(levelname)s - %(message)s'
+    )
+    _CONFIGURED = True
+
+
+# Compact encoder reused for every payload that does not go through the fast path
+_enc = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+
+def resolve_drone(drone_ip, drone_port):
+    """
+    Resolve the drone address once so reconnects can skip name resolution.
+
+    Returns:
+        tuple: getaddrinfo entry (family, type, proto, canonname, sockaddr)
+    """
+    return socket.getaddrinfo(drone_ip, drone_port, socket.AF_INET, socket.SOCK_STREAM)[0]
+
+
+def open_drone_socket(addrinfo):
+    """
+    Create a TCP socket with the sensor-side options applied and connect it to the drone.
+
+    Args:
+        addrinfo (tuple): getaddrinfo entry for the drone
+
+    Returns:
+        socket.socket: Connected socket in blocking mode
+
+    Raises:
+        socket.error: If the connection could not be established
+    """
+    family, type_, proto, _, sockaddr = addrinfo
+    sock = socket.socket(family, type_, proto)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(sockaddr)
+        sock.settimeout(None)  # Timeout only bounds the handshake, sends stay blocking
+    except socket.error:
+        # A failed connect cannot be retried reliably on the same descriptor once a
+        # timeout is set, so release it now instead of leaking it until the next attempt
+        sock.close()
+        raise
+
+    # Linux-only options: ack immediately and fail silently-dead links promptly.
+    # Both are best-effort; a platform that lacks or rejects one still gets the other
+    for option, value in (('TCP_QUICKACK', 1), ('TCP_USER_TIMEOUT', TCP_USER_TIMEOUT_MS)):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except (AttributeError, OSError):
+            pass
+    return sock
+
+
+def abort_socket(sock):
+    """
+    Close a socket on a failure path with an RST (SO_LINGER of zero) instead of a FIN,
+    so the connection does not sit in TIME_WAIT holding its address/port pair.
+
+    Args:
+        sock (socket.socket): Socket to close
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+    except socket.error:
+        pass
+    try:
+        sock.close()
+    except:
+        pass
+
+
+class DroneConnection:
+    """
+    One TCP connection to a drone shared by every SensorNode in the process.
+    Readings from all sensors are accumulated and written by a background thread
+    once a packet's worth of data is pending or the debounce window expires.
+    """
+
+    _instances = {}
+    _instances_lock = Lock()
+
+    def __init__(self, drone_ip, drone_port):
+        """
+        Initialize the shared connection; the socket is opened by connect().
+
+        Args:
+            drone_ip (str): IP address of the drone to connect to
+            drone_port (int): Port number for the drone connection
+        """
+        self.drone_ip = drone_ip
+        self.drone_port = drone_port
+        self._addrinfo = None
+        self.socket = None
+        self.connected = False
+        self._buf = bytearray()
+        self._cond = Condition()
+        self._flusher = None
+        self.logger = logging.getLogger(f"drone_link_{drone_port}")
+
+    @classmethod
+    def shared(cls, drone_ip, drone_port):
+        """
+        Get the process-wide connection for a drone address, creating it on first use.
+
+        Returns:
+            DroneConnection: Shared connection instance
+        """
+        with cls._instances_lock:
+            key = (drone_ip, drone_port)
+            if key not in cls._instances:
+                cls._instances[key] = cls(drone_ip, drone_port)
+            return cls._instances[key]
+
+    @classmethod
+    def close_all(cls):
+        """
+        Flush and close every shared connection in the process.
+        """
+        with cls._instances_lock:
+            for connection in cls._instances.values():
+                connection.close()
+
+    def connect(self):
+        """
+        Connect to the drone unless another sensor already has.
+
+        Returns:
+            bool: True once the shared connection is up
+
+        Raises:
+            socket.error: If the connection could not be established, so each sensor
+                can pick its reconnect backoff from the error like a dedicated socket
+        """
+        with self._cond:
+            if self.connected:
+                return True
+            if self._addrinfo is None:
+                self._addrinfo = resolve_drone(self.drone_ip, self.drone_port)
+            self.socket = open_drone_socket(self._addrinfo)
+            self.connected = True
+            self.logger.info(f"Connected to drone at {self.drone_ip}:{self.drone_port}")
+
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = Thread(target=self._flush_loop, name=f"drone_link_{self.drone_port}",
+                                       daemon=True)
+                self._flusher.start()
+            return True
+
+    def enqueue(self, payload):
+        """
+        Queue encoded readings for the next write.
+
+        Args:
+            payload (bytes): One or more newline-terminated JSON lines
+
+        Returns:
+            bool: True if queued, False if the shared connection is down
+        """
+        with self._cond:
+            if not self.connected:
+                return False
+            self._buf += payload
+            self._cond.notify()
+            return True
+
+    def _flush_loop(self):
+        """
+        Background writer: wait for data, debounce briefly, then send it in one call.
+        """
+        while True:
+            with self._cond:
+                while not self._buf:
+                    self._cond.wait()
+                deadline = time.monotonic() + SHARED_FLUSH_INTERVAL
+                while len(self._buf) < SHARED_FLUSH_BYTES:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                data = bytes(self._buf)
+                self._buf.clear()
+                sock = self.socket
+
+            try:
+                sock.sendall(data)
+            except (socket.error, AttributeError) as e:
+                with self._cond:
+                    if self.socket is sock:
+                        self._drop(f"Error sending data: {e}")
+
+    def _drop(self, reason):
+        """
+        Mark the connection down so sensors reconnect; caller holds the condition.
+        """
+        self.logger.error(reason)
+        self.connected = False
+        self._buf.clear()
+        if self.socket:
+            abort_socket(self.socket)
+            self.socket = None
+
+    def close(self):
+        """
+        Send any pending data and close the socket.
+        """
+        with self._cond:
+            if self.connected and self._buf:
+                try:
+                    self.socket.sendall(bytes(self._buf))
+                except socket.error:
+                    pass
+            self._buf.clear()
+            self.connected = False
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+                self.socket = None
+
+
+class RepairScheduler:
+    """
+    Single background thread that runs delayed callbacks for every sensor in the
+    process, instead of one threading.Timer (and one OS thread) per failure.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty schedule; the worker thread starts with the first entry.
+        """
+        self._queue = []  # Heap of [due, seq, callback] entries
+        self._seq = itertools.count()
+        self._cond = Condition()
+        self._thread = None
+        self.logger = logging.getLogger("repair_scheduler")
+
+    def schedule(self, delay, callback):
+        """
+        Run callback after delay seconds.
+
+        Returns:
+            list: Entry handle that can be passed to cancel()
+        """
+        with self._cond:
+            entry = [time.monotonic() + delay, next(self._seq), callback]
+            heapq.heappush(self._queue, entry)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="repair_scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return entry
+
+    def cancel(self, entry):
+        """
+        Cancel a scheduled callback; the entry is skipped when it comes due.
+        """
+        with self._cond:
+            entry[2] = None
+
+    def _run(self):
+        """
+        Worker loop: sleep until the earliest entry is due, then run its callback.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+                    delay = self._queue[0][0] - time.monotonic()
+                    if delay <= 0:
+                        callback = heapq.heappop(self._queue)[2]
+                        break
+                    self._cond.wait(delay)
+
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as e:
+                    self.logger.error(f"Scheduled callback failed: {e}")
+
+
+_repair_scheduler = RepairScheduler()
+
 
 class SensorNode:
     """
@@ -12,8 +370,20 @@ class SensorNode:
     to a drone via TCP connection. Includes simulation of random failures and self-healing.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, smaller nodes and faster lookups
+    __slots__ = (
+        'sensor_id', 'drone_ip', 'drone_port', 'send_interval', 'flush_interval',
+        'socket', 'connected', 'running', 'logger',
+        'failure_probability', 'repair_time', 'is_broken', 'repair_timer',
+        '_addrinfo', '_shared', '_tmpl', '_stop', '_prev_backoff', '_connect_error',
+        '_iov', '_iov_bytes', '_first_queued',
+        '_ts_sec', '_ts_str', '_ts_bytes',
+        '_rng', '_pool', '_pi',
+    )
+
     def __init__(self, sensor_id, drone_ip, drone_port,
-                 failure_probability=0.05, repair_time=5, min_interval=1, max_interval=2):
+                 failure_probability=0.05, repair_time=5, min_interval=1, max_interval=2,
+                 flush_interval=0.0, shared_connection=False):
         """
         Initialize the SensorNode with configuration parameters.
 
@@ -25,14 +395,43 @@ class SensorNode:
             repair_time (int): Fixed repair time in seconds
             min_interval (int): Minimum data send interval in seconds
             max_interval (int): Maximum data send interval in seconds
+            flush_interval (float): Maximum seconds a reading may wait in the send batch
+                (0 sends every reading immediately)
+            shared_connection (bool): Send over the process-wide DroneConnection instead
+                of a dedicated socket
         """
         self.sensor_id = sensor_id
         self.drone_ip = drone_ip
         self.drone_port = drone_port        
+        self._addrinfo = None  # Cached getaddrinfo entry for the drone, resolved on first connect
+        self._shared = DroneConnection.shared(drone_ip, drone_port) if shared_connection else None
+        # The sensor_id is fixed for the node lifetime, so the whole line is a constant
+        # template and encoding a reading collapses to a single bytes % call
+        escaped_id = _enc(sensor_id).replace('%', '%%')
+        self._tmpl = ('{"sensor_id":' + escaped_id +
+                      ',"timestamp":"%s","temperature":%.1f,"humidity":%.1f}\n').encode('utf-8')
         self.send_interval = random.uniform(min_interval, max_interval)
         self.socket = None
+        # Encoded readings waiting to be written with a single sendmsg call
+        self.flush_interval = flush_interval
+        self._iov = []
+        self._iov_bytes = 0
+        self._first_queued = None  # Monotonic time the oldest batched reading was queued
         self.connected = False
         self.running = False
+        self._stop = Event()  # Set by stop() to interrupt reconnection waits
+        self._prev_backoff = BACKOFF_BASE  # Last reconnect wait; reset once a connect succeeds
+        self._connect_error = None  # Exception from the last failed connect, used to pick the backoff
+
+        # Formatted timestamp cache, refreshed at most once per wall-clock second
+        self._ts_sec = 0
+        self._ts_str = ""
+        self._ts_bytes = b""  # Encoded form of _ts_str for the send template
+
+        # Pre-generated uniform samples consumed by collect_environmental_data
+        self._rng = np.random.default_rng() if USING_NUMPY else None
+        self._pool = self._refill_pool()
+        self._pi = 0
 
         # Failure simulation parameters
         self.failure_probability = failure_probability
@@ -41,10 +440,7 @@ class SensorNode:
         self.repair_timer = None
 
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format=f'[{self.sensor_id}] %(asctime)s - %(levelname)s - %(message)s'
-        )
+        _configure_logging()
         self.logger = logging.getLogger(self.sensor_id)
 
     def connect_to_drone(self):
@@ -58,17 +454,58 @@ class SensorNode:
             self.logger.warning("Cannot connect: sensor is currently broken")
             return False
 
+        self._connect_error = None
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.drone_ip, self.drone_port))
+            if self._shared is not None:
+                self.connected = self._shared.connect()
+                self.logger.info(f"Using shared connection to drone at {self.drone_ip}:{self.drone_port}")
+                return True
+
+            # Resolve the drone address once and reuse it for every reconnect
+            if self._addrinfo is None:
+                self._addrinfo = resolve_drone(self.drone_ip, self.drone_port)
+            self.socket = open_drone_socket(self._addrinfo)
             self.connected = True
             self.logger.info(f"Connected to drone at {self.drone_ip}:{self.drone_port}")
             return True
+        except socket.timeout as e:
+            self.connected = False
+            self.socket = None
+            self._connect_error = e
+            self.logger.error(f"Failed to connect to drone: no answer within {CONNECT_TIMEOUT} seconds")
+            return False
         except socket.error as e:
             self.connected = False
+            self.socket = None
+            self._connect_error = e
             self.logger.error(f"Failed to connect to drone: {e}")
             return False
 
+    def _refill_pool(self):
+        """
+        Generate a fresh chunk of uniform [0, 1) samples.
+
+        Returns:
+            list: RNG_POOL_SIZE Python floats
+        """
+        if USING_NUMPY:
+            return self._rng.random(RNG_POOL_SIZE).tolist()
+        return [random.random() for _ in range(RNG_POOL_SIZE)]
+
+    def _rand(self):
+        """
+        Draw the next uniform [0, 1) sample from the pool, refilling it when exhausted.
+
+        Returns:
+            float: Uniform random sample
+        """
+        v = self._pool[self._pi]
+        self._pi += 1
+        if self._pi == RNG_POOL_SIZE:
+            self._pool = self._refill_pool()
+            self._pi = 0
+        return v
+
     def collect_environmental_data(self):
         """
         Simulate collecting temperature and humidity data.
@@ -80,33 +517,77 @@ class SensorNode:
             self.logger.warning("Cannot collect data: sensor is currently broken")
             return None
 
-        # Simulate temperature data (20-30°C with occasional anomalies)
-        temperature = random.uniform(20.0, 30.0)
+        # Draw all six samples up front and blend normal/anomalous candidates with
+        # 0/1 masks so the per-cycle cost does not depend on whether an anomaly occurs
+        r0, r1, r2, r3, r4, r5 = (self._rand(), self._rand(), self._rand(),
+                                  self._rand(), self._rand(), self._rand())
 
-        # Occasionally generate anomalous temperature readings (1% chance)
-        if random.random() < 0.05:
-            temperature = random.uniform(90.0, 1000.0)  # Anomalously high temperature
+        # Simulate temperature data (20-30°C), anomalously high (90-1000°C) 5% of the time
+        m_t = r2 < TEMP_ANOMALY_RATE
+        temperature = (20.0 + r0 * 10.0) * (1 - m_t) + (90.0 + r1 * 910.0) * m_t
 
-        humidity = random.uniform(30.0, 60.0)
-        # Simulate humidity data (30-60%)
+        # Simulate humidity data (30-60%), anomalously high (80-1000%) 1% of the time
+        m_h = r5 < HUMIDITY_ANOMALY_RATE
+        humidity = (30.0 + r3 * 30.0) * (1 - m_h) + (80.0 + r4 * 920.0) * m_h
 
-        # Occasionally generate anomalous humidity readings (1% chance)
-        if random.random() < 0.01:
-            humidity = random.uniform(80.0, 1000.0)  # Anomalously high humidity
-
-        # Create timestamp in ISO 8601 format
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Create timestamp in ISO 8601 format (local time, as the rest of the system expects)
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.localtime(now))
+            self._ts_bytes = self._ts_str.encode('ascii')
+        timestamp = self._ts_str
 
         data = {
             "sensor_id": self.sensor_id,
             "timestamp": timestamp,
-            "temperature": round(temperature, 1),
-            "humidity": round(humidity, 1)
+            # Raw floats; precision is fixed to one decimal by the %.1f send template
+            "temperature": temperature,
+            "humidity": humidity
         }
 
-        self.logger.debug(f"Collected data: {data}")
+        self.logger.debug("Collected data: %r", data)
         return data
 
+    @classmethod
+    def collect_batch(cls, sensors):
+        """
+        Collect one reading for each of many in-process sensors at once. Library API for
+        callers driving many nodes from one loop; run_sensors keeps one thread per node.
+
+        Args:
+            sensors (list): SensorNode instances to sample
+
+        Returns:
+            list: One reading dict per sensor, None for broken sensors
+        """
+        if not USING_NUMPY:
+            return [sensor.collect_environmental_data() for sensor in sensors]
+
+        n = len(sensors)
+        rng = _batch_rng
+
+        temps = rng.uniform(20.0, 30.0, n)
+        anom = rng.random(n) < TEMP_ANOMALY_RATE
+        temps[anom] = rng.uniform(90.0, 1000.0, anom.sum())
+        temps = np.round(temps, 1)
+
+        humidities = rng.uniform(30.0, 60.0, n)
+        anom = rng.random(n) < HUMIDITY_ANOMALY_RATE
+        humidities[anom] = rng.uniform(80.0, 1000.0, anom.sum())
+        humidities = np.round(humidities, 1)
+
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return [
+            None if sensor.is_broken else {
+                "sensor_id": sensor.sensor_id,
+                "timestamp": timestamp,
+                "temperature": temperature,
+                "humidity": humidity
+            }
+            for sensor, temperature, humidity in zip(sensors, temps.tolist(), humidities.tolist())
+        ]
+
     def send_data(self, data):
         """
         Send the collected data to the drone.
@@ -126,14 +607,94 @@ class SensorNode:
             return False
 
         try:
-            json_data = json.dumps(data)
-            self.socket.sendall((json_data + "\n").encode('utf-8'))
-            self.logger.info(f"Sent data: Temperature={data['temperature']}°C, Humidity={data['humidity']}%")
+            # Fixed 4-field schema: fill the precompiled template instead of walking the encoder
+            # Only the timestamp and the two numbers vary; reuse the cached timestamp bytes
+            # when the reading came from collect_environmental_data this second
+            timestamp = data['timestamp']
+            ts_bytes = self._ts_bytes if timestamp is self._ts_str else timestamp.encode('ascii')
+            payload = self._tmpl % (ts_bytes, data['temperature'], data['humidity'])
+            now = time.monotonic()
+            if not self._iov:
+                self._first_queued = now
+            self._iov.append(payload)
+            self._iov_bytes += len(payload)
+            if (len(self._iov) >= SEND_BATCH_SIZE or self._iov_bytes >= SEND_BATCH_BYTES or
+                    now - self._first_queued >= self.flush_interval):
+                return self.flush()
+            # %-style arguments are only formatted if the record passes the level filter
+            self.logger.debug("Queued data: Temperature=%.1f°C, Humidity=%.1f%%",
+                              data['temperature'], data['humidity'])
+            return True
+        except socket.error as e:
+            self.connected = False
+            self.logger.error(f"Error sending data: {e}")
+            return False
+
+    def flush(self):
+        """
+        Write all batched readings to the drone in one syscall.
+
+        Returns:
+            bool: True if the batch was sent (or empty), False otherwise
+        """
+        if not self._iov:
+            return True
+
+        try:
+            if self._shared is not None:
+                if not self._shared.enqueue(b''.join(self._iov)):
+                    self.connected = False
+                    self.logger.error("Error sending data: shared drone connection is down")
+                    return False
+            elif HAS_SENDMSG:
+                sent = self.socket.sendmsg(self._iov)
+                if sent < self._iov_bytes:
+                    self.socket.sendall(b''.join(self._iov)[sent:])
+            else:
+                self.socket.sendall(b''.join(self._iov))
+            self.logger.debug("Sent %d readings", len(self._iov))
             return True
         except socket.error as e:
             self.connected = False
             self.logger.error(f"Error sending data: {e}")
             return False
+        finally:
+            self._iov.clear()
+            self._iov_bytes = 0
+            self._first_queued = None
+
+    def _discard_batch(self):
+        """
+        Drop readings still waiting in the send batch when the link is aborted, so they
+        are not sent after reconnecting with timestamps from before the failure.
+        """
+        if self._iov:
+            self.logger.debug("Discarding %d unsent readings", len(self._iov))
+            self._iov.clear()
+            self._iov_bytes = 0
+            self._first_queued = None
+
+    def _wait_until(self, deadline):
+        """
+        Sleep until the given monotonic deadline, flushing the pending batch as soon as
+        its oldest reading has waited flush_interval rather than at the next reading.
+
+        Args:
+            deadline (float): time.monotonic() value to wait for
+
+        Returns:
+            bool: True if stop was requested while waiting, False otherwise
+        """
+        while True:
+            wake = deadline
+            if self._first_queued is not None:
+                wake = min(wake, self._first_queued + self.flush_interval)
+            delay = wake - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                return True
+            if wake >= deadline:
+                return False
+            self.flush()
 
     def handle_reconnection(self):
         """
@@ -148,12 +709,11 @@ class SensorNode:
 
         self.logger.info("Attempting to reconnect to drone...")
 
-        # Close the current socket if it exists
+        # Close the current socket if it exists, along with anything still batched for it
+        self._discard_batch()
         if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
+            abort_socket(self.socket)
+            self.socket = None
 
         # Attempt to reconnect
         max_attempts = 5
@@ -162,15 +722,26 @@ class SensorNode:
         while current_attempt < max_attempts and self.running and not self.is_broken:
             current_attempt += 1
             self.logger.info(f"Reconnection attempt {current_attempt}/{max_attempts}")
+            attempt_start = time.monotonic()
 
             if self.connect_to_drone():
                 self.logger.info("Reconnection successful")
+                self._prev_backoff = BACKOFF_BASE
                 return True
 
-            # Wait before next attempt with exponential backoff
-            wait_time = 2 ** current_attempt
-            self.logger.info(f"Waiting {wait_time} seconds before next attempt...")
-            time.sleep(wait_time)
+            # Wait before next attempt with decorrelated jitter so sensors that lost the
+            # drone together do not retry in lockstep; time spent connecting counts
+            # toward the wait. A refused connect means the drone is reachable but not
+            # listening yet, so it gets a much shorter cap than a timeout.
+            if isinstance(self._connect_error, ConnectionRefusedError):
+                cap = REFUSED_BACKOFF_CAP
+            else:
+                cap = BACKOFF_CAP
+            self._prev_backoff = min(cap, random.uniform(BACKOFF_BASE, self._prev_backoff * 3))
+            wait_time = max(0.0, attempt_start + self._prev_backoff - time.monotonic())
+            self.logger.info(f"Waiting {wait_time:.1f} seconds before next attempt...")
+            if self._stop.wait(wait_time):
+                return False
 
         self.logger.error("Failed to reconnect after multiple attempts")
         return False
@@ -179,23 +750,22 @@ class SensorNode:
         """
         Simulate a random sensor failure with a fixed repair time.
         """
-        if not self.is_broken and random.random() < self.failure_probability:
+        if not self.is_broken and self._rand() < self.failure_probability:
             self.is_broken = True
 
-            # Close connection if any
+            # Close connection if any; batched readings die with the sensor. On a shared
+            # connection the socket stays up for the other sensors, so the drone sees this
+            # sensor go silent rather than disconnect; it still reconnects after repair
+            self._discard_batch()
             if self.socket:
-                try:
-                    self.socket.close()
-                    self.connected = False
-                except:
-                    pass
+                abort_socket(self.socket)
+                self.socket = None
+            self.connected = False
 
             self.logger.error(f"SENSOR FAILURE: Node has broken down! Will be offline for {self.repair_time} seconds")
 
             # Schedule the repair after the repair time
-            self.repair_timer = Timer(self.repair_time, self.repair_sensor)
-            self.repair_timer.daemon = True
-            self.repair_timer.start()
+            self.repair_timer = _repair_scheduler.schedule(self.repair_time, self.repair_sensor)
 
     def repair_sensor(self):
         """
@@ -210,6 +780,7 @@ class SensorNode:
         Main loop for the sensor node operation.
         """
         self.running = True
+        self._stop.clear()
 
         if not self.connect_to_drone():
             self.logger.error("Initial connection failed. Attempting reconnection...")
@@ -217,6 +788,10 @@ class SensorNode:
                 self.logger.error("Could not establish connection. Exiting.")
                 return
 
+        # Readings are scheduled against absolute monotonic deadlines so the time spent
+        # collecting and sending does not accumulate as drift in the reporting period
+        next_deadline = time.monotonic()
+
         try:
             while self.running:
                 # Check if sensor should randomly fail
@@ -224,44 +799,106 @@ class SensorNode:
 
 
                 if not self.connected and not self.handle_reconnection():
-                    time.sleep(10)  # Wait before trying again
+                    if self._stop.wait(10):  # Wait before trying again
+                        break
                     continue
 
                 data = self.collect_environmental_data()
                 if data and not self.send_data(data):
                     continue  # Will trigger reconnection on next loop
 
-                time.sleep(self.send_interval)
+                next_deadline += self.send_interval
+                if next_deadline > time.monotonic():
+                    if self._wait_until(next_deadline):
+                        break
+                else:
+                    next_deadline = time.monotonic()  # Fell behind (e.g. reconnecting); restart the schedule
 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received. Shutting down...")
         finally:
             self.stop()
 
-    def stop(self):
+    def request_stop(self):
         """
-        Stop the sensor node and clean up resources.
+        Ask the node to stop from another thread; run() notices and cleans up itself.
         """
         self.running = False
+        self._stop.set()
+
+    def stop(self):
+        """
+        Stop the sensor node and clean up resources. Called from the thread running
+        the node (run() does so on exit); other threads use request_stop().
+        """
+        self.request_stop()
         if self.repair_timer:
-            self.repair_timer.cancel()
+            _repair_scheduler.cancel(self.repair_timer)
+        if self.connected and not self.is_broken:
+            self.flush()
         if self.socket:
+            try:
+                # Graceful FIN so the drone receives everything flushed above
+                self.socket.shutdown(socket.SHUT_WR)
+            except socket.error:
+                pass
             try:
                 self.socket.close()
                 self.logger.info("Socket closed")
             except:
                 pass
+            self.socket = None
+            self.connected = False
         self.logger.info("Sensor node stopped")
 
 
+def run_sensors(sensors):
+    """
+    Run several sensor nodes inside this process, one thread each, until they
+    all exit or a keyboard interrupt is received.
+
+    Args:
+        sensors (list): SensorNode instances to run
+    """
+    threads = []
+    try:
+        previous_stack_size = stack_size(SENSOR_THREAD_STACK_SIZE)
+    except (ValueError, RuntimeError):
+        previous_stack_size = None  # Platform does not allow changing it; keep the default
+    try:
+        for sensor in sensors:
+            thread = Thread(target=sensor.run, name=sensor.sensor_id, daemon=True)
+            thread.start()
+            threads.append(thread)
+    finally:
+        if previous_stack_size is not None:
+            stack_size(previous_stack_size)
+
+    try:
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+    except KeyboardInterrupt:
+        print("Keyboard interrupt received. Shutting down...")
+    finally:
+        # Only signal the sensors: each thread flushes and closes its own socket as
+        # run() exits, so nothing touches a node's batch or socket concurrently
+        for sensor in sensors:
+            sensor.request_stop()
+        for thread in threads:
+            thread.join(timeout=5)
+        DroneConnection.close_all()
+
+
 def main():
     """
     Main function to run when the script is executed directly.
     """
     import argparse
 
-    parser = argparse.ArgumentParser(description='Start a sensor node')
-    parser.add_argument('--id', type=str, default='sensor_01', help='Sensor ID')
+    parser = argparse.ArgumentParser(description='Start one or more sensor nodes')
+    parser.add_argument('--id', type=str, nargs='+', default=['sensor_01'],
+                        help='Sensor ID (several IDs run as threads in this process)')
     parser.add_argument('--ip', type=str, default='127.0.0.1', help='Drone IP address')
     parser.add_argument('--port', type=int, default=3400, help='Drone port')    
     parser.add_argument('--failure-rate', type=float, default=0.05,
@@ -272,27 +909,43 @@ def main():
                         help='Minimum data sending interval in seconds')
     parser.add_argument('--max-interval', type=float, default=2,
                         help='Maximum data sending interval in seconds')
+    parser.add_argument('--shared-connection', action='store_true',
+                        help='Send all sensors in this process over one drone connection '
+                             '(a failed sensor then goes silent instead of dropping the connection)')
+    parser.add_argument('--flush-interval', type=float, default=0.0,
+                        help='Maximum seconds to batch readings before sending (0 = send immediately)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log every reading sent (DEBUG level)')
 
     args = parser.parse_args()
-
-    sensor = SensorNode(
-        args.id,
-        args.ip,
-        args.port,
-        args.failure_rate,
-        args.repair_time,
-        args.min_interval,
-        args.max_interval
-    )
-
-    print(f"Starting sensor node {args.id}...")
-    print(f"Connecting to drone at {args.ip}:{args.port}")
-    print(f"Data sending interval: will be random between {args.min_interval} and {args.max_interval} seconds")
-    print(f"Failure simulation: {args.failure_rate*100}% chance per cycle")
-    print(f"Fixed repair time: {args.repair_time} seconds")
-    print("Press Ctrl+C to stop")
-
-    sensor.run()
+    _configure_logging(logging.DEBUG if args.verbose else logging.INFO)
+
+    sensors = [
+        SensorNode(
+            sensor_id,
+            args.ip,
+            args.port,
+            args.failure_rate,
+            args.repair_time,
+            args.min_interval,
+            args.max_interval,
+            args.flush_interval,
+            args.shared_connection
+        )
+        for sensor_id in args.id
+    ]
+
+    # Emit the startup banner as a single write
+    print("\n".join([
+        f"Starting sensor node(s) {', '.join(args.id)}...",
+        f"Connecting to drone at {args.ip}:{args.port}",
+        f"Data sending interval: will be random between {args.min_interval} and {args.max_interval} seconds",
+        f"Failure simulation: {args.failure_rate*100}% chance per cycle",
+        f"Fixed repair time: {args.repair_time} seconds",
+        "Press Ctrl+C to stop",
+    ]), flush=True)
+
+    run_sensors(sensors)
 
 
 if __name__ == "__main__":